@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from .models import TaskData
+from .update_descriptor import UpdateDescriptor
+
+
+__all__ = ["ParseState", "apply_metadata", "build_descriptor", "parse_priority", "scan_tokens", "scan_words"]
+
+
+_PRIORITY_WORDS = {"h": 1, "high": 1, "m": 5, "medium": 5, "l": 9, "low": 9}
+
+
+def parse_priority(raw: str) -> int | None:
+    if not raw:
+        return None
+    candidate = raw.strip().lower()
+    named = _PRIORITY_WORDS.get(candidate)
+    if named is not None:
+        return named
+    # Branch on the digits instead of letting int() raise for words
+    digits = candidate[1:] if candidate[:1] in ("-", "+") else candidate
+    if digits.isdecimal():
+        return int(candidate)
+    return None
+
+
+@dataclass(slots=True)
+class ParseState:
+    description_parts: list[str] = field(default_factory=list)
+    additions: list[str] = field(default_factory=list)
+    removals: list[str] = field(default_factory=list)
+    due: str | None = None
+    wait: str | None = None
+    priority: int | None = None
+    status: str | None = None
+    summary: str | None = None
+    url: str | None = None
+    x_properties: dict[str, str] = field(default_factory=dict)
+
+
+def _set_project(state: ParseState, value: str) -> bool:
+    state.x_properties["X-PROJECT"] = value  # Empty string signals "unset"
+    return True
+
+
+def _set_due(state: ParseState, value: str) -> bool:
+    state.due = value  # Keep empty string to signal "unset"
+    return True
+
+
+def _set_wait(state: ParseState, value: str) -> bool:
+    state.wait = value  # Keep empty string to signal "unset"
+    return True
+
+
+def _set_priority(state: ParseState, value: str) -> bool:
+    if not value:
+        state.priority = 0  # Use 0 to signal "unset"
+    else:
+        parsed_priority = parse_priority(value)
+        if parsed_priority is not None:
+            state.priority = parsed_priority
+    return True
+
+
+def _set_status(state: ParseState, value: str) -> bool:
+    state.status = value.upper() if value else None
+    return True
+
+
+def _set_summary(state: ParseState, value: str) -> bool:
+    state.summary = value
+    return True
+
+
+def _set_x_property(state: ParseState, value: str) -> bool:
+    prop_key, sep, prop_value = value.partition(":")
+    if not sep:
+        return False  # Not a property assignment
+    state.x_properties[prop_key] = prop_value
+    return True
+
+
+def _set_url(state: ParseState, value: str) -> bool:
+    state.url = value  # Empty string signals "unset"
+    return True
+
+
+_META_HANDLERS: dict[str, Callable[[ParseState, str], bool]] = {
+    "project": _set_project,
+    "due": _set_due,
+    "wait": _set_wait,
+    "pri": _set_priority,
+    "status": _set_status,
+    "summary": _set_summary,
+    "x": _set_x_property,
+    "url": _set_url,
+}
+
+
+def apply_metadata(state: ParseState, key: str, value: str) -> bool:
+    """Apply a ``key:value`` token to ``state``.
+
+    Returns False when the key is unknown or the value is not usable, so the
+    caller can decide how to treat the token.
+    """
+    handler = _META_HANDLERS.get(key.lower())
+    return handler is not None and handler(state, value)
+
+
+def scan_tokens(raw: str) -> ParseState:
+    """Scan whitespace-separated update tokens into a :class:`ParseState`."""
+    return scan_words(raw.split())
+
+
+def scan_words(words: Iterable[str]) -> ParseState:
+    """Scan already-split update words (no embedded whitespace)."""
+    state = ParseState()
+    for token in words:
+        # Tags
+        if token.startswith("+") and len(token) > 1:
+            state.additions.append(token[1:])
+            continue
+        if token.startswith("-") and len(token) > 1:
+            state.removals.append(token[1:])
+            continue
+
+        # Key-value metadata. Tokens come from str.split(), so neither the
+        # key nor the value carries surrounding whitespace.
+        key, sep, rest = token.partition(":")
+        if sep and apply_metadata(state, key, rest):
+            continue
+
+        # Description word
+        state.description_parts.append(token)
+    return state
+
+
+def build_descriptor(state: ParseState) -> UpdateDescriptor:
+    addition_set = set(state.additions)
+    removal_set = set(state.removals)
+    # A tag both added and removed cancels out; that is rare, so only build
+    # the differences when the two sets actually overlap
+    if not addition_set.isdisjoint(removal_set):
+        addition_set, removal_set = addition_set - removal_set, removal_set - addition_set
+
+    description = " ".join(state.description_parts)
+    # Use summary if explicitly set, otherwise use description
+    final_summary = state.summary if state.summary is not None else (description if description else None)
+
+    add_data: TaskData[str] = TaskData(
+        summary=final_summary,
+        status=state.status,
+        due=state.due,
+        wait=state.wait,
+        priority=state.priority,
+        x_properties=state.x_properties,
+        categories=list(addition_set) if addition_set else None,
+        url=state.url,
+    )
+
+    remove_data: TaskData[str] = TaskData(
+        categories=list(removal_set) if removal_set else None,
+    )
+
+    return UpdateDescriptor(add_data=add_data, remove_data=remove_data)
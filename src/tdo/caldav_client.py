@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import logging
+import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from time import perf_counter
-from typing import Dict, TYPE_CHECKING
-from uuid import uuid4
+from typing import Any, Dict, Iterator, Sequence, TYPE_CHECKING
+from urllib.parse import quote, urlsplit
+from xml.sax.saxutils import escape as xml_escape
 
 import arrow
 
 from .config import CaldavConfig
 from .diff import TaskDiff, TaskSetDiff
 from .models import Attachment, Task, TaskData, TaskPatch, TaskPayload
-from .sqlite_cache import SqliteTaskCache
+from .sqlite_cache import DirtyTask, SqliteTaskCache
 
 if TYPE_CHECKING:
     from caldav import DAVClient, Calendar
@@ -23,10 +31,94 @@ if TYPE_CHECKING:
 # Sentinel value to indicate a datetime field should be explicitly unset
 _UNSET_DATETIME = datetime(1, 1, 1, 0, 0, 0)
 
-
-def _debug_log(stage: str, duration: float, info: str | None = None) -> None:
-    suffix = f" {info}" if info else ""
-    print(f"[timing] {stage}: {duration:.3f}s{suffix}")
+_DAV_RESPONSE = "{DAV:}response"
+_DAV_HREF = "{DAV:}href"
+_DAV_GETETAG = "{DAV:}getetag"
+_CALDAV_DATA = "{urn:ietf:params:xml:ns:caldav}calendar-data"
+_CS_GETCTAG = "{http://calendarserver.org/ns/}getctag"
+
+# Request bodies are encoded once at import, already CRLF-terminated, so
+# each request skips the str -> bytes encode.
+_CTAG_PROPFIND = (
+    b'<?xml version="1.0" encoding="utf-8"?>\r\n'
+    b'<D:propfind xmlns:D="DAV:" xmlns:CS="http://calendarserver.org/ns/">\r\n'
+    b"  <D:prop><CS:getctag/></D:prop>\r\n"
+    b"</D:propfind>"
+)
+
+_ETAG_REPORT = (
+    b'<?xml version="1.0" encoding="utf-8"?>\r\n'
+    b'<C:calendar-query xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">\r\n'
+    b"  <D:prop><D:getetag/></D:prop>\r\n"
+    b"  <C:filter>\r\n"
+    b'    <C:comp-filter name="VCALENDAR"><C:comp-filter name="VTODO"/></C:comp-filter>\r\n'
+    b"  </C:filter>\r\n"
+    b"</C:calendar-query>"
+)
+
+# calendar-multiget bodies are _MULTIGET_HEAD + <D:href> elements + _MULTIGET_TAIL
+_MULTIGET_HEAD = (
+    b'<?xml version="1.0" encoding="utf-8"?>\r\n'
+    b'<C:calendar-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">\r\n'
+    b"  <D:prop><D:getetag/><C:calendar-data/></D:prop>\r\n"
+)
+_MULTIGET_TAIL = b"\r\n</C:calendar-multiget>"
+
+_ICS_HEADER = "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//todo-cli//EN\r\nBEGIN:VTODO\r\n"
+_ICS_FOOTER = "END:VTODO\r\nEND:VCALENDAR\r\n"
+
+# UIDs generated per os.urandom() call when creating tasks
+_UID_POOL_SIZE = 128
+# Random bytes per UID suffix (16 hex chars, as secrets.token_hex(8))
+_UID_TOKEN_BYTES = 8
+# Characters in a summary that would be awkward in a UID-derived href
+_UID_SAFE_TABLE = str.maketrans({" ": "_", ":": "_", "/": "_"})
+# Parsed VTODO bodies remembered per client, keyed on the raw ICS text
+_PARSE_CACHE_SIZE = 4096
+# Objects per calendar-multiget REPORT
+_MULTIGET_BATCH = 100
+# Concurrent HTTP requests issued by push() and pull()
+_HTTP_WORKERS = 8
+
+
+# HTTP sessions shared by every CalDAVClient in the process, keyed on
+# (calendar_url, username), so re-entering a client reuses open connections
+_SESSIONS: dict[tuple[str, str | None], Any] = {}
+
+
+def _share_session(client: "DAVClient", key: tuple[str, str | None]) -> None:
+    session = _SESSIONS.get(key)
+    if session is None:
+        _SESSIONS[key] = client.session
+        return
+    # Credentials travel with each request, not the session, so swapping is safe
+    client.session.close()
+    client.session = session
+
+
+@atexit.register
+def _close_sessions() -> None:
+    while _SESSIONS:
+        _, session = _SESSIONS.popitem()
+        session.close()
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _VTodoFields:
+    """Properties collected while scanning one VTODO."""
+    summary: str = ""
+    uid: str = ""
+    due: datetime | None = None
+    wait: datetime | None = None
+    priority: int | None = None
+    status: str | None = None
+    url: str | None = None
+    x_properties: Dict[str, str] = field(default_factory=dict)
+    categories: list[str] = field(default_factory=list)
+    attachments: list[Attachment] = field(default_factory=list)
 
 
 @dataclass
@@ -90,6 +182,8 @@ class CalDAVClient:
     client: "DAVClient" | None = field(default=None, init=False)
     calendar: "Calendar" | None = field(default=None, init=False)
     cache: SqliteTaskCache | None = field(default=None, init=False)
+    _uid_pool: deque[str] = field(default_factory=deque, init=False, repr=False)
+    _parsed: dict[str, tuple[str, TaskData]] = field(default_factory=dict, init=False, repr=False)
 
     @classmethod
     async def create(cls, config: CaldavConfig, cache_path: Path | None = None) -> CalDAVClient:
@@ -109,6 +203,7 @@ class CalDAVClient:
             username=self.config.username,
             password=self.config.getpass(),
         )
+        _share_session(self.client, (self.config.calendar_url, self.config.username))
         if self.config.token and self.client.session:
             self.client.session.headers["Authorization"] = f"Bearer {self.config.token}"
         calendar = None
@@ -126,8 +221,7 @@ class CalDAVClient:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        if self.client and self.client.session:
-            self.client.session.close()
+        # The session is shared and closed at interpreter exit
         self.client = None
         self.calendar = None
 
@@ -136,6 +230,10 @@ class CalDAVClient:
             await self.cache.close()
             self.cache = None
 
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        """Group cache mutations so a multi-task command commits once."""
+        return self._ensure_cache().transaction()
+
     def _ensure_cache(self) -> SqliteTaskCache:
         if self.cache is None:
             raise RuntimeError("cache is not initialized; use CalDAVClient.create()")
@@ -152,20 +250,26 @@ class CalDAVClient:
         *,
         exclude_waiting: bool = True,
         task_filter: "TaskFilter | None" = None,
+        projection: Sequence[str] | None = None,
     ) -> list[Task]:
         """List active tasks using SQL filtering."""
         return await self._ensure_cache().list_active_tasks(
             exclude_waiting=exclude_waiting,
             task_filter=task_filter,
+            columns=projection,
         )
 
     async def list_waiting_tasks(
         self,
         *,
         task_filter: "TaskFilter | None" = None,
+        projection: Sequence[str] | None = None,
     ) -> list[Task]:
         """List waiting tasks using SQL filtering."""
-        return await self._ensure_cache().list_waiting_tasks(task_filter=task_filter)
+        return await self._ensure_cache().list_waiting_tasks(
+            task_filter=task_filter,
+            columns=projection,
+        )
 
     async def create_task(self, payload: TaskPayload) -> Task:
         uid = self._uid_from_summary(payload.summary)
@@ -195,6 +299,9 @@ class CalDAVClient:
     async def modify_task(self, task: Task, patch: TaskPatch) -> Task:
         updated = self._apply_patch(task, patch)
         pending_action = await self._ensure_cache().get_pending_action(task.uid)
+        if pending_action is None and updated.data == task.data:
+            # No-op patch: leave the task clean so push doesn't rewrite it
+            return updated
         action = "create" if pending_action == "create" else "update"
         await self._ensure_cache().upsert_task(updated, pending_action=action)
         return updated
@@ -235,12 +342,20 @@ class CalDAVClient:
         else:
             priority = task.data.priority
         status = patch.status or task.data.status
-        x_properties = dict(task.data.x_properties)
-        x_properties.update(patch.x_properties)
-        # Remove properties with empty values (signals deletion)
-        x_properties = {k: v for k, v in x_properties.items() if v}
-        categories = patch.categories if patch.categories is not None else task.data.categories
-        categories = list(categories or [])
+        # Copy-on-write: containers the patch doesn't touch are shared with
+        # the original task instead of being copied on every modify.
+        x_properties = task.data.x_properties
+        if patch.x_properties:
+            # Remove properties with empty values (signals deletion)
+            x_properties = {
+                k: v for k, v in {**x_properties, **patch.x_properties}.items() if v
+            }
+        if patch.categories is not None:
+            categories = list(patch.categories)
+        elif task.data.categories is not None:
+            categories = task.data.categories
+        else:
+            categories = []
         # Handle URL: empty string = unset, None = no change
         if patch.url == "":
             url = None
@@ -249,9 +364,9 @@ class CalDAVClient:
         else:
             url = task.data.url
         # Handle attachments: additive by default
-        attachments = list(task.data.attachments)
+        attachments = task.data.attachments
         if patch.attachments:
-            attachments.extend(patch.attachments)
+            attachments = [*attachments, *patch.attachments]
         return Task(
             uid=task.uid,
             data=TaskData(
@@ -267,6 +382,7 @@ class CalDAVClient:
             ),
             href=task.href,
             task_index=task.task_index,
+            etag=task.etag,
         )
 
     async def pull(self, *, dry_run: bool = False) -> PullResult:
@@ -278,27 +394,20 @@ class CalDAVClient:
         before = await cache.list_tasks()
         before_by_uid = {t.uid: t for t in before}
 
-        # Fetch remote tasks
+        # Skip the fetch entirely when the collection ctag is unchanged
         calendar = self._ensure_calendar()
-        resources = calendar.todos()
-        remote_tasks: list[Task] = []
-        for todo in resources:
-            try:
-                task = self._task_from_resource(todo)
-                remote_tasks.append(task)
-            except Exception as e:
-                # Try to extract UID for error reporting
-                uid = "unknown"
-                try:
-                    if hasattr(todo, "id"):
-                        uid = str(todo.id)
-                    elif hasattr(todo, "url"):
-                        uid = str(todo.url)
-                except Exception:
-                    pass
-                error = SyncError(uid=uid, action="parse", error=str(e))
-                errors.append(error)
-                _debug_log("pull_error", 0.0, f"uid={uid} action=parse error={e}")
+        ctag = self._fetch_ctag(calendar)
+        if ctag is not None and ctag == await cache.get_meta("ctag"):
+            logger.debug(
+                "pull: %.3fs count=%d ctag unchanged dry_run=%s",
+                perf_counter() - start,
+                len(before),
+                dry_run,
+            )
+            return PullResult(tasks=list(before), diff=TaskSetDiff(diffs={}), dry_run=dry_run)
+
+        # Fetch remote tasks
+        remote_tasks = await self._fetch_remote_tasks(calendar, errors)
 
         # In dry run mode, compute diff without modifying cache
         if dry_run:
@@ -333,13 +442,18 @@ class CalDAVClient:
                 diffs[key] = TaskDiff(pre=pre, post=post)
 
             diff: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
-            elapsed = perf_counter() - start
-            error_info = f" errors={len(errors)}" if errors else ""
-            _debug_log("pull", elapsed, f"count={len(remote_tasks)}{error_info} (dry run)")
+            logger.debug(
+                "pull: %.3fs count=%d errors=%d (dry run)",
+                perf_counter() - start,
+                len(remote_tasks),
+                len(errors),
+            )
             return PullResult(tasks=list(before), diff=diff, errors=errors, dry_run=True)
 
         # Replace cache with remote tasks
         await cache.replace_remote_tasks(remote_tasks)
+        # Only trust the ctag when every object made it into the cache
+        await cache.set_meta("ctag", ctag if not errors else None)
 
         # Get cached state after pull (with assigned indices)
         after = await cache.list_tasks()
@@ -381,9 +495,12 @@ class CalDAVClient:
                 max_entries=self.config.cache.transaction_log_size,
             )
 
-        elapsed = perf_counter() - start
-        error_info = f" errors={len(errors)}" if errors else ""
-        _debug_log("pull", elapsed, f"count={len(remote_tasks)}{error_info}")
+        logger.debug(
+            "pull: %.3fs count=%d errors=%d",
+            perf_counter() - start,
+            len(remote_tasks),
+            len(errors),
+        )
         return PullResult(tasks=after, diff=diff, errors=errors, dry_run=False)
 
     async def push(self, *, dry_run: bool = False) -> PushResult:
@@ -392,78 +509,40 @@ class CalDAVClient:
         pending = await cache.dirty_tasks()
         diffs: dict[int, TaskDiff] = {}
         errors: list[SyncError] = []
-        successfully_deleted: list[str] = []
 
-        if pending:
-            calendar = self._ensure_calendar() if not dry_run else None
+        if pending and dry_run:
             for entry in pending:
+                diffs[entry.task.task_index] = self._push_diff(entry)
+        elif pending:
+            calendar = self._ensure_calendar()
+            # Fire the HTTP requests concurrently, then apply the results to
+            # the cache in the original order.
+            outcomes = await self._run_push_requests(pending, calendar)
+            synced_tasks: list[Task] = []
+            successfully_deleted: list[str] = []
+            for entry, outcome in zip(pending, outcomes):
                 task = entry.task
-                index = task.task_index
-
-                try:
-                    if entry.action == "create":
-                        if dry_run:
-                            diffs[index] = TaskDiff(pre=None, post=task.data)
-                        else:
-                            synced = self._push_create(task, calendar)
-                            # Handle creates from both tasks and completed_tasks
-                            if task.data.status == "COMPLETED":
-                                await cache._insert_completed_task(
-                                    synced,
-                                    pending_action=None,
-                                    last_synced=time.time(),
-                                    completed_at=time.time(),
-                                    task_index=task.task_index,
-                                )
-                            else:
-                                await cache.upsert_task(
-                                    synced,
-                                    last_synced=time.time(),
-                                    clear_pending=True,
-                                )
-                            diffs[index] = TaskDiff(pre=None, post=task.data)
-                    elif entry.action == "update":
-                        if dry_run:
-                            diffs[index] = TaskDiff(pre=TaskData(), post=task.data)
-                        else:
-                            synced = self._push_update(task, calendar)
-                            # Handle updates from both tasks and completed_tasks
-                            if task.data.status == "COMPLETED":
-                                await cache._insert_completed_task(
-                                    synced,
-                                    pending_action=None,
-                                    last_synced=time.time(),
-                                    completed_at=time.time(),
-                                    task_index=task.task_index,
-                                )
-                            else:
-                                await cache.upsert_task(
-                                    synced,
-                                    last_synced=time.time(),
-                                    clear_pending=True,
-                                )
-                            # Use empty TaskData as synthetic pre to trigger is_update
-                            diffs[index] = TaskDiff(pre=TaskData(), post=task.data)
-                    else:  # delete
-                        if dry_run:
-                            diffs[index] = TaskDiff(pre=task.data, post=None)
-                        else:
-                            self._push_delete(task, calendar)
-                            diffs[index] = TaskDiff(pre=task.data, post=None)
-                            successfully_deleted.append(task.uid)
-                except Exception as e:
+                if isinstance(outcome, Exception):
                     error = SyncError(
                         uid=task.uid,
                         action=entry.action,
-                        error=str(e),
-                        task_index=index,
+                        error=str(outcome),
+                        task_index=task.task_index,
                     )
                     errors.append(error)
-                    _debug_log("push_error", 0.0, f"uid={task.uid} action={entry.action} error={e}")
+                    logger.debug("push error: uid=%s action=%s error=%s", task.uid, entry.action, outcome)
+                    continue
+                if entry.action == "delete":
+                    successfully_deleted.append(task.uid)
+                else:
+                    synced_tasks.append(outcome)
+                diffs[task.task_index] = self._push_diff(entry)
 
+            if synced_tasks:
+                await cache.upsert_many(synced_tasks, last_synced=time.time())
             # Flush only successfully deleted tasks after push
-            if not dry_run and successfully_deleted:
-                await cache.flush_deleted_tasks()
+            if successfully_deleted:
+                await cache.flush_deleted_tasks(successfully_deleted)
 
         diff: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
 
@@ -478,12 +557,49 @@ class CalDAVClient:
                 max_entries=self.config.cache.transaction_log_size,
             )
 
-        elapsed = perf_counter() - start
-        mode = " (dry run)" if dry_run else ""
-        error_info = f" errors={len(errors)}" if errors else ""
-        _debug_log("push", elapsed, f"pending={len(pending)}{error_info}{mode}")
+        logger.debug(
+            "push: %.3fs pending=%d errors=%d dry_run=%s",
+            perf_counter() - start,
+            len(pending),
+            len(errors),
+            dry_run,
+        )
         return PushResult(diff=diff, errors=errors, dry_run=dry_run)
 
+    @staticmethod
+    def _push_diff(entry: DirtyTask) -> TaskDiff:
+        task = entry.task
+        if entry.action == "create":
+            return TaskDiff(pre=None, post=task.data)
+        if entry.action == "update":
+            # Use empty TaskData as synthetic pre to trigger is_update
+            return TaskDiff(pre=TaskData(), post=task.data)
+        return TaskDiff(pre=task.data, post=None)
+
+    async def _run_push_requests(
+        self, pending: list[DirtyTask], calendar: "Calendar"
+    ) -> list[Task | None | BaseException]:
+        """Run each pending entry's HTTP request on a bounded thread pool.
+
+        The caldav client is synchronous; its session keeps a connection
+        pool, so the requests overlap instead of paying one RTT each.
+        """
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=_HTTP_WORKERS) as executor:
+            futures = [
+                loop.run_in_executor(executor, self._push_entry, entry, calendar)
+                for entry in pending
+            ]
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+    def _push_entry(self, entry: DirtyTask, calendar: "Calendar") -> Task | None:
+        if entry.action == "create":
+            return self._push_create(entry.task, calendar)
+        if entry.action == "update":
+            return self._push_update(entry.task, calendar)
+        self._push_delete(entry.task, calendar)
+        return None
+
     async def sync(self, *, dry_run: bool = False) -> SyncResult:
         pulled = await self.pull(dry_run=dry_run)
         pushed = await self.push(dry_run=dry_run)
@@ -495,30 +611,177 @@ class CalDAVClient:
         return self.calendar
 
 
-    def _push_create(self, task: Task, calendar: "Calendar") -> Task:
-        body = self._build_ics(
-            task.data.summary,
-            task.data.due,
-            task.data.wait,
-            task.data.priority,
-            task.data.x_properties,
-            task.data.categories,
-            task.uid,
-            task.data.status,
-            task.data.url,
-            task.data.attachments,
+    def _fetch_ctag(self, calendar: "Calendar") -> str | None:
+        """Return the collection's getctag, or None if the server lacks it."""
+        if self.client is None:
+            return None
+        try:
+            response = self.client.propfind(str(calendar.url), _CTAG_PROPFIND, depth=0)
+        except Exception:
+            return None
+        if response.status not in (200, 207) or response.tree is None:
+            return None
+        for element in response.tree.iter(_CS_GETCTAG):
+            if element.text:
+                return element.text.strip()
+        return None
+
+    async def _fetch_remote_tasks(self, calendar: "Calendar", errors: list[SyncError]) -> list[Task]:
+        """Fetch remote tasks, downloading only objects whose etag changed.
+
+        Falls back to a full ``calendar.todos()`` fetch when the server
+        rejects the etag REPORT.
+        """
+        try:
+            etags = self._fetch_etags(calendar)
+        except Exception as e:
+            logger.debug("pull: etag REPORT failed, falling back to full fetch: %s", e)
+            return self._fetch_all_todos(calendar, errors)
+
+        cached = await self._ensure_cache().synced_tasks_by_href()
+        remote_tasks: list[Task] = []
+        stale: list[str] = []
+        for href, etag in etags.items():
+            task = cached.get(href)
+            if task is not None and task.etag == etag:
+                remote_tasks.append(task)
+            else:
+                stale.append(href)
+
+        for href, etag, data in self._fetch_bodies(calendar, stale):
+            try:
+                task = self._task_from_data(data)
+            except Exception as e:
+                errors.append(SyncError(uid=href, action="parse", error=str(e)))
+                logger.debug("pull error: uid=%s action=parse error=%s", href, e)
+                continue
+            task.href = href
+            task.etag = etag
+            remote_tasks.append(task)
+        logger.debug("pull: reused=%d fetched=%d", len(remote_tasks) - len(stale), len(stale))
+        return remote_tasks
+
+    def _fetch_all_todos(self, calendar: "Calendar", errors: list[SyncError]) -> list[Task]:
+        resources = calendar.todos()
+        remote_tasks: list[Task] = []
+        for todo in resources:
+            try:
+                task = self._task_from_resource(todo)
+                remote_tasks.append(task)
+            except Exception as e:
+                # Try to extract UID for error reporting
+                uid = "unknown"
+                try:
+                    if hasattr(todo, "id"):
+                        uid = str(todo.id)
+                    elif hasattr(todo, "url"):
+                        uid = str(todo.url)
+                except Exception:
+                    pass
+                error = SyncError(uid=uid, action="parse", error=str(e))
+                errors.append(error)
+                logger.debug("pull error: uid=%s action=parse error=%s", uid, e)
+        return remote_tasks
+
+    def _fetch_etags(self, calendar: "Calendar") -> dict[str, str]:
+        """Map object href to etag for every VTODO in one calendar-query REPORT."""
+        if self.client is None:
+            raise RuntimeError("caldav client is not initialized")
+        response = self.client.report(str(calendar.url), _ETAG_REPORT, depth=1)
+        tree = self._multistatus_tree(response)
+        etags: dict[str, str] = {}
+        for element in tree.iter(_DAV_RESPONSE):
+            href = element.findtext(_DAV_HREF)
+            etag = element.findtext(f".//{_DAV_GETETAG}")
+            if href and etag:
+                etags[str(calendar.url.join(href.strip()))] = etag.strip()
+        return etags
+
+    def _fetch_bodies(
+        self, calendar: "Calendar", hrefs: list[str]
+    ) -> Iterator[tuple[str, str | None, str]]:
+        """Yield (href, etag, ics) for ``hrefs`` via batched calendar-multiget.
+
+        Batches are yielded as they arrive, so the caller parses one while
+        later ones are still downloading and only in-flight bodies are held
+        in memory.
+        """
+        if not hrefs:
+            return
+        if self.client is None:
+            raise RuntimeError("caldav client is not initialized")
+        batches = [
+            hrefs[offset : offset + _MULTIGET_BATCH]
+            for offset in range(0, len(hrefs), _MULTIGET_BATCH)
+        ]
+        if len(batches) == 1:
+            yield from self._fetch_batch(calendar, batches[0])
+            return
+        # Batches are independent REPORTs, so overlap their round trips
+        with ThreadPoolExecutor(max_workers=_HTTP_WORKERS) as pool:
+            for chunk in pool.map(lambda batch: self._fetch_batch(calendar, batch), batches):
+                yield from chunk
+
+    def _fetch_batch(
+        self, calendar: "Calendar", hrefs: list[str]
+    ) -> list[tuple[str, str | None, str]]:
+        assert self.client is not None
+        body = b"".join(
+            (
+                _MULTIGET_HEAD,
+                "".join(
+                    f"<D:href>{xml_escape(urlsplit(href).path)}</D:href>" for href in hrefs
+                ).encode(),
+                _MULTIGET_TAIL,
+            )
         )
-        todo = calendar.add_todo(body)
-        synced = self._task_from_resource(todo)
-        # Ensure we keep the original UID (server might return different/empty UID)
+        response = self.client.report(str(calendar.url), body, depth=1)
+        tree = self._multistatus_tree(response)
+        results: list[tuple[str, str | None, str]] = []
+        for element in tree.iter(_DAV_RESPONSE):
+            href = element.findtext(_DAV_HREF)
+            data = element.findtext(f".//{_CALDAV_DATA}")
+            if not href or data is None:
+                continue
+            etag = element.findtext(f".//{_DAV_GETETAG}")
+            results.append((str(calendar.url.join(href.strip())), etag.strip() if etag else None, data))
+        return results
+
+    @staticmethod
+    def _multistatus_tree(response):
+        if response.status not in (200, 207) or response.tree is None:
+            raise RuntimeError(f"unexpected REPORT response status {response.status}")
+        return response.tree
+
+    def _push_create(self, task: Task, calendar: "Calendar") -> Task:
+        body = self._ics_for(task)
+        # PUT straight to a UID-derived href rather than add_todo(), which
+        # lets the library round-trip the object to discover its URL.
+        href = str(calendar.url.join(quote(task.uid, safe="") + ".ics"))
+        etag = self._put_ics(href, body, {"If-None-Match": "*"})
+        return self._synced(task, href, etag)
+
+    def _push_update(self, task: Task, calendar: "Calendar") -> Task:
+        body = self._ics_for(task, summary=task.data.summary or task.uid)
+        if task.href:
+            # Guard against overwriting a newer server copy when we know
+            # which version we last saw.
+            headers = {"If-Match": task.etag} if task.etag else {}
+            etag = self._put_ics(task.href, body, headers)
+            return self._synced(task, task.href, etag)
+        resource = self._resource_for_update(task, calendar)
+        resource.id = task.uid
+        resource.data = body
+        resource.save()
+        synced = self._task_from_resource(resource)
+        # Ensure we keep the original UID and index (server might return different/empty UID)
         synced.uid = task.uid
         synced.task_index = task.task_index
         return synced
 
-    def _push_update(self, task: Task, calendar: "Calendar") -> Task:
-        summary = task.data.summary or task.uid
-        body = self._build_ics(
-            summary,
+    def _ics_for(self, task: Task, *, summary: str | None = None) -> str:
+        return self._build_ics(
+            summary if summary is not None else task.data.summary,
             task.data.due,
             task.data.wait,
             task.data.priority,
@@ -529,26 +792,60 @@ class CalDAVClient:
             task.data.url,
             task.data.attachments,
         )
-        resource = self._resource_for_update(task, calendar)
-        resource.id = task.uid
-        resource.data = body
-        resource.save()
-        synced = self._task_from_resource(resource)
-        # Ensure we keep the original UID and index (server might return different/empty UID)
-        synced.uid = task.uid
-        synced.task_index = task.task_index
-        return synced
+
+    def _put_ics(self, href: str, body: str, headers: dict[str, str]) -> str | None:
+        """PUT an iCalendar body and return the new etag, if the server sent one."""
+        from caldav import error as caldav_error
+
+        if self.client is None:
+            raise RuntimeError("caldav client is not initialized")
+        response = self.client.put(
+            href, body, {"Content-Type": 'text/calendar; charset="utf-8"', **headers}
+        )
+        if response.status == 412:
+            raise caldav_error.PutError(f"{href} changed on the server since the last pull")
+        if response.status not in (200, 201, 204):
+            raise caldav_error.PutError(f"PUT {href} failed with status {response.status}")
+        etag = response.headers.get("ETag")
+        # Weak validators can't be used with If-Match, so don't keep them
+        if etag and etag.startswith("W/"):
+            return None
+        return etag
+
+    @staticmethod
+    def _synced(task: Task, href: str, etag: str | None) -> Task:
+        return Task(
+            uid=task.uid,
+            data=task.data,
+            href=href,
+            task_index=task.task_index,
+            etag=etag,
+        )
 
     def _push_delete(self, task: Task, calendar: "Calendar") -> None:
         from caldav import error as caldav_error
 
+        if task.href:
+            # The cached href saves the todo_by_uid search round trip.  The
+            # DELETE is unconditional, as todo.delete() was: the etag kept
+            # for a deleted row is never refreshed by a pull, so an If-Match
+            # would fail forever once the object changed on the server.
+            assert self.client is not None
+            response = self.client.request(task.href, "DELETE", "", {})
+            if response.status in (404, 410):
+                logger.debug("push: uid=%s already deleted on server", task.uid)
+            elif response.status not in (200, 204):
+                raise caldav_error.DeleteError(
+                    f"DELETE {task.href} failed with status {response.status}"
+                )
+            return
         try:
             todo = calendar.todo_by_uid(task.uid)
             if todo:
                 todo.delete()
         except caldav_error.NotFoundError:
             # Task already gone from server - that's the desired state
-            _debug_log("push_delete", 0.0, f"uid={task.uid} already deleted on server")
+            logger.debug("push: uid=%s already deleted on server", task.uid)
 
     def _resource_for_update(self, task: Task, calendar: "Calendar") -> "CalendarObjectResource":
         from caldav.objects import CalendarObjectResource
@@ -579,98 +876,136 @@ class CalDAVClient:
         url: str | None = None,
         attachments: list[Attachment] | None = None,
     ) -> str:
-        lines = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//todo-cli//EN",
-            "BEGIN:VTODO",
-            f"UID:{uid}",
-            f"SUMMARY:{summary}",
-        ]
-        if status:
-            lines.append(f"STATUS:{status}")
-        if priority is not None:
-            lines.append(f"PRIORITY:{priority}")
-        if due is not None:
-            lines.append(f"DUE:{self._format_due(due)}")
-        if wait is not None:
-            lines.append(f"DTSTART:{self._format_due(wait)}")
-        if categories:
-            lines.append(f"CATEGORIES:{','.join(categories)}")
-        if url:
-            lines.append(f"URL:{url}")
-        for attach in attachments or []:
-            if attach.fmttype:
-                lines.append(f"ATTACH;FMTTYPE={attach.fmttype}:{attach.uri}")
-            else:
-                lines.append(f"ATTACH:{attach.uri}")
-        for name, value in x_properties.items():
-            lines.append(f"{name}:{value}")
-        lines.extend(["END:VTODO", "END:VCALENDAR"])
-        return "\r\n".join(lines) + "\r\n"
+        # Assembled as one template instead of a list joined per call
+        attach_lines = "".join(
+            f"ATTACH;FMTTYPE={attach.fmttype}:{attach.uri}\r\n"
+            if attach.fmttype
+            else f"ATTACH:{attach.uri}\r\n"
+            for attach in attachments or ()
+        )
+        x_lines = "".join(f"{name}:{value}\r\n" for name, value in x_properties.items())
+        return (
+            f"{_ICS_HEADER}UID:{uid}\r\nSUMMARY:{summary}\r\n"
+            f"{f'STATUS:{status}\r\n' if status else ''}"
+            f"{f'PRIORITY:{priority}\r\n' if priority is not None else ''}"
+            f"{f'DUE:{self._format_due(due)}\r\n' if due is not None else ''}"
+            f"{f'DTSTART:{self._format_due(wait)}\r\n' if wait is not None else ''}"
+            f"{f'CATEGORIES:{','.join(categories)}\r\n' if categories else ''}"
+            f"{f'URL:{url}\r\n' if url else ''}"
+            f"{attach_lines}{x_lines}{_ICS_FOOTER}"
+        )
 
     def _format_due(self, value: datetime) -> str:
-        return value.strftime("%Y%m%dT%H%M%SZ")
+        return (
+            f"{value.year:04d}{value.month:02d}{value.day:02d}"
+            f"T{value.hour:02d}{value.minute:02d}{value.second:02d}Z"
+        )
 
     def _task_from_data(self, data: str) -> Task:
-        summary = ""
-        due = None
-        wait = None
-        priority = None
-        status: str | None = None
-        x_properties: Dict[str, str] = {}
-        uid = ""
-        categories: list[str] = []
-        url: str | None = None
-        attachments: list[Attachment] = []
-        for raw in data.splitlines():
-            line = raw.strip()
-            if not line or ":" not in line:
+        # Bodies seen before in this client (re-pulls, save round trips) skip
+        # the parse.  TaskData is never mutated in place, so sharing is safe.
+        parsed = self._parsed.get(data)
+        if parsed is None:
+            parsed = self._parse_vtodo(data)
+            if len(self._parsed) >= _PARSE_CACHE_SIZE:
+                # Start over rather than track recency; push parses from
+                # worker threads, and clear() is safe to race with.
+                self._parsed.clear()
+            self._parsed[data] = parsed
+        uid, task_data = parsed
+        return Task(uid=uid, data=task_data)
+
+    def _parse_vtodo(self, data: str) -> tuple[str, TaskData]:
+        fields = _VTodoFields()
+        handlers = self._VTODO_HANDLERS
+        # Start at the VTODO so VTIMEZONE properties (its DTSTART in
+        # particular) are never mistaken for the task's own.
+        start = data.find("BEGIN:VTODO")
+        if start > 0:
+            data = data[start:]
+        depth = 0
+        # Servers send CRLF, but XML parsing of calendar-data folds it to LF
+        for line in data.split("\n"):
+            if line.endswith("\r"):
+                line = line[:-1]
+            # Skip blanks and folded continuation lines
+            if not line or line[0] in " \t":
                 continue
-            key, value = line.split(":", 1)
-            # Handle DUE;TZID=...:value or DUE:value
-            if key == "DUE" or key.startswith("DUE;"):
-                tzid = self._extract_tzid(key)
-                due = self._parse_due(value, tzid)
-            # Handle DTSTART;TZID=...:value or DTSTART:value (wait)
-            elif key == "DTSTART" or key.startswith("DTSTART;"):
-                tzid = self._extract_tzid(key)
-                wait = self._parse_due(value, tzid)
-            elif key == "SUMMARY":
-                summary = value
-            elif key == "UID":
-                uid = value
-            elif key == "PRIORITY":
-                try:
-                    priority = int(value)
-                except ValueError:
-                    pass
-            elif key == "STATUS":
-                status = value
-            elif key == "CATEGORIES":
-                categories.extend(self._split_categories(value))
-            elif key == "URL":
-                url = value
-            elif key == "ATTACH" or key.startswith("ATTACH;"):
-                fmttype = self._extract_fmttype(key)
-                attachments.append(Attachment(uri=value, fmttype=fmttype))
+            if line.startswith("BEGIN:"):
+                depth += 1
+                continue
+            if line.startswith("END:"):
+                depth -= 1
+                if depth <= 0:
+                    # Nothing after END:VTODO belongs to the task
+                    break
+                continue
+            if depth > 1:
+                # Nested component such as VALARM
+                continue
+            idx = line.find(":")
+            if idx < 0:
+                continue
+            key = line[:idx]
+            semi = key.find(";")
+            handler = handlers.get(key if semi < 0 else key[:semi])
+            if handler is not None:
+                handler(self, fields, key, line[idx + 1 :])
             elif key.startswith("X-"):
-                x_properties[key] = value
-        return Task(
-            uid=uid,
-            data=TaskData(
-                summary=summary,
-                status=status or "NEEDS-ACTION",
-                due=due,
-                wait=wait,
-                priority=priority,
-                x_properties=x_properties,
-                categories=categories,
-                url=url,
-                attachments=attachments,
-            ),
+                fields.x_properties[key] = line[idx + 1 :]
+        return fields.uid, TaskData(
+            summary=fields.summary,
+            status=fields.status or "NEEDS-ACTION",
+            due=fields.due,
+            wait=fields.wait,
+            priority=fields.priority,
+            x_properties=fields.x_properties,
+            categories=fields.categories,
+            url=fields.url,
+            attachments=fields.attachments,
         )
 
+    def _on_due(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.due = self._parse_due(value, self._extract_tzid(key))
+
+    def _on_dtstart(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.wait = self._parse_due(value, self._extract_tzid(key))
+
+    def _on_summary(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.summary = value
+
+    def _on_uid(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.uid = value
+
+    def _on_priority(self, fields: _VTodoFields, key: str, value: str) -> None:
+        if value.isdigit():
+            fields.priority = int(value)
+
+    def _on_status(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.status = value
+
+    def _on_categories(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.categories.extend(self._split_categories(value))
+
+    def _on_url(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.url = value
+
+    def _on_attach(self, fields: _VTodoFields, key: str, value: str) -> None:
+        fields.attachments.append(Attachment(uri=value, fmttype=self._extract_fmttype(key)))
+
+    # VTODO property name (without parameters) -> handler
+    _VTODO_HANDLERS = {
+        "DUE": _on_due,
+        "DTSTART": _on_dtstart,
+        "SUMMARY": _on_summary,
+        "UID": _on_uid,
+        "PRIORITY": _on_priority,
+        "STATUS": _on_status,
+        "CATEGORIES": _on_categories,
+        "URL": _on_url,
+        "ATTACH": _on_attach,
+    }
+
     def _extract_tzid(self, key: str) -> str | None:
         """Extract TZID from a property key like 'DUE;TZID=America/New_York'."""
         if ";" not in key:
@@ -697,33 +1032,50 @@ class CalDAVClient:
         - 20250102T030405 with tzid (timezone-aware)
         - 20250102T030405 without tzid (assume local, convert to UTC)
         """
-        if not raw:
+        # Fixed layout, so slice it rather than going through strptime
+        utc = raw.endswith("Z")
+        if len(raw) != 15 + utc or raw[8] != "T":
+            return None
+        if not (raw[:8].isdigit() and raw[9:15].isdigit()):
             return None
-
         try:
-            # Handle Z suffix (already UTC)
-            if raw.endswith("Z"):
-                return datetime.strptime(raw, "%Y%m%dT%H%M%SZ")
-
-            # Parse the datetime value
-            dt = datetime.strptime(raw, "%Y%m%dT%H%M%S")
-
-            # If timezone provided, use arrow to convert to UTC
-            if tzid:
-                try:
-                    parsed = arrow.get(dt, tzid)
-                    return parsed.to("UTC").naive
-                except Exception:
-                    # Fall back to treating as local time
-                    pass
-
-            # No timezone - assume local time, convert to UTC
-            return arrow.get(dt).to("UTC").naive
+            dt = datetime(
+                int(raw[0:4]),
+                int(raw[4:6]),
+                int(raw[6:8]),
+                int(raw[9:11]),
+                int(raw[11:13]),
+                int(raw[13:15]),
+            )
         except ValueError:
             return None
+        if utc:
+            return dt
+
+        # If timezone provided, use arrow to convert to UTC
+        if tzid:
+            try:
+                parsed = arrow.get(dt, tzid)
+                return parsed.to("UTC").naive
+            except Exception:
+                # Fall back to treating as local time
+                pass
+
+        # No timezone - assume local time, convert to UTC
+        return arrow.get(dt).to("UTC").naive
 
     def _split_categories(self, raw: str) -> list[str]:
         return [candidate.strip() for candidate in raw.split(",") if candidate.strip()]
 
     def _uid_from_summary(self, summary: str) -> str:
-        return f"{summary.replace(' ', '_')}-{uuid4()}"
+        if not self._uid_pool:
+            self._refill_uid_pool()
+        return f"{summary.translate(_UID_SAFE_TABLE)}-{self._uid_pool.popleft()}"
+
+    def _refill_uid_pool(self, count: int = _UID_POOL_SIZE) -> None:
+        """Pre-generate 64-bit random hex suffixes from a single urandom read."""
+        raw = os.urandom(_UID_TOKEN_BYTES * count)
+        self._uid_pool.extend(
+            raw[offset : offset + _UID_TOKEN_BYTES].hex()
+            for offset in range(0, len(raw), _UID_TOKEN_BYTES)
+        )
@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import csv
+import functools
+import logging
 import os
 import random
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Awaitable, Callable, NoReturn, Sequence, TypeVar
 
-from rich import box
-from rich.console import Console
-from rich.table import Table
-
+from ._parse_core import parse_priority as _parse_priority
 from .config import (
     CaldavConfig,
     config_file_path,
@@ -21,12 +21,14 @@ from .config import (
     load_config_from_path,
     resolve_env,
     write_config_file,
+    _parse_bool_like,
 )
 from .diff import TaskDiff, TaskSetDiff
 from .models import Attachment, Task, TaskData, TaskFilter, TaskPatch, TaskPayload
+from .sqlite_cache import LISTING_COLUMNS
 from .time_parser import parse_due_value
 from .update_descriptor import UpdateDescriptor
-from .update_linear_parser import parse_update
+from .update_linear_parser import parse_update_tokens
 
 
 T = TypeVar("T")
@@ -54,10 +56,11 @@ async def _run_with_client(env: str | None, callback: Callable[["CalDAVClient"],
         await client.close()
 
 
-async def _cache_client(env: str | None) -> "CalDAVClient":
+async def _cache_client(env: str | None, config: CaldavConfig | None = None) -> "CalDAVClient":
     from .caldav_client import CalDAVClient
 
-    config = _resolve_config(env)
+    if config is None:
+        config = _resolve_config(env)
     return await CalDAVClient.create(config)
 
 
@@ -73,7 +76,7 @@ def _resolve_config(env: str | None) -> CaldavConfig:
 def _split_categories_value(raw: str | None) -> list[str]:
     if not raw:
         return []
-    return [segment.strip() for segment in raw.split(",") if segment.strip()]
+    return [tag for tag in map(str.strip, raw.split(",")) if tag]
 
 
 def _exit_with_message(message: str) -> NoReturn:
@@ -91,21 +94,6 @@ def _require_value(value: str | None, prompt_text: str) -> str:
     return response
 
 
-def _parse_priority(raw: str) -> int | None:
-    candidate = raw.strip().lower()
-    if candidate in {"h", "high"}:
-        return 1
-    if candidate in {"m", "medium"}:
-        return 5
-    if candidate in {"l", "low"}:
-        return 9
-    try:
-        value = int(raw)
-        return value
-    except ValueError:
-        return None
-
-
 def _has_changes(patch: TaskData) -> bool:
     return bool(
         patch.summary
@@ -127,8 +115,9 @@ def _truncate_summary(summary: str, max_len: int = 30) -> str:
 
 
 def _parse_update_descriptor(tokens: Sequence[str]) -> UpdateDescriptor:
-    raw = " ".join(token.strip() for token in tokens if token and token.strip())
-    return parse_update(raw)
+    if not tokens:
+        return UpdateDescriptor()
+    return parse_update_tokens(tokens)
 
 
 def _resolve_due_value(raw: str | None) -> datetime | None:
@@ -145,11 +134,10 @@ def _apply_tag_changes(existing: Sequence[str] | None, descriptor: UpdateDescrip
     remove_tags = descriptor.remove_data.categories or []
     if not add_tags and not remove_tags:
         return None
-    normalized = {tag.strip() for tag in existing or [] if tag.strip()}
-    additions = {tag.strip() for tag in add_tags if tag.strip()}
-    removals = {tag.strip() for tag in remove_tags if tag.strip()}
-    normalized.update(additions)
-    normalized.difference_update(removals)
+    normalized = set(map(str.strip, existing or ()))
+    normalized.update(map(str.strip, add_tags))
+    normalized.difference_update(map(str.strip, remove_tags))
+    normalized.discard("")
     return sorted(normalized)
 
 
@@ -169,13 +157,20 @@ def _has_update_candidates(descriptor: UpdateDescriptor) -> bool:
     )
 
 
+def _split_x_properties(x_properties: dict[str, str]) -> tuple[dict[str, str], str | None]:
+    """Separate CATEGORIES from parsed X- properties, copying only if it is present."""
+    if "CATEGORIES" not in x_properties:
+        return x_properties, None
+    remaining = {key: value for key, value in x_properties.items() if key != "CATEGORIES"}
+    return remaining, x_properties["CATEGORIES"]
+
+
 def _build_payload(descriptor: UpdateDescriptor) -> TaskPayload:
     add = descriptor.add_data
     summary = add.summary
     due = _resolve_due_value(add.due)
     wait = _resolve_due_value(add.wait)
-    x_properties = dict(add.x_properties)
-    raw_categories = x_properties.pop("CATEGORIES", None)
+    x_properties, raw_categories = _split_x_properties(add.x_properties)
     metadata_categories = _split_categories_value(raw_categories)
     base_categories = metadata_categories if raw_categories is not None else None
     tags_value = _apply_tag_changes(base_categories, descriptor)
@@ -195,19 +190,22 @@ def _build_payload(descriptor: UpdateDescriptor) -> TaskPayload:
     )
 
 
+def _resolve_patch_dates(descriptor: UpdateDescriptor) -> tuple[datetime | None, datetime | None]:
+    """Resolve a descriptor's due/wait once so multi-task patches share them."""
+    add = descriptor.add_data
+    # Handle empty string as "unset" using sentinel datetime
+    due = _UNSET_DATETIME if add.due == "" else _resolve_due_value(add.due)
+    wait = _UNSET_DATETIME if add.wait == "" else _resolve_due_value(add.wait)
+    return due, wait
+
+
 def _build_patch_from_descriptor(
-    descriptor: UpdateDescriptor, existing: Task | None
+    descriptor: UpdateDescriptor,
+    existing: Task | None,
+    dates: tuple[datetime | None, datetime | None] | None = None,
 ) -> TaskPatch:
     add = descriptor.add_data
-    # Handle empty string as "unset" using sentinel datetime
-    if add.due == "":
-        due = _UNSET_DATETIME
-    else:
-        due = _resolve_due_value(add.due)
-    if add.wait == "":
-        wait = _UNSET_DATETIME
-    else:
-        wait = _resolve_due_value(add.wait)
+    due, wait = dates if dates is not None else _resolve_patch_dates(descriptor)
     patch = TaskPatch(
         summary=add.summary,
         priority=add.priority,  # 0 signals unset
@@ -216,8 +214,7 @@ def _build_patch_from_descriptor(
         status=add.status,
         url=add.url,  # Empty string signals "unset", None = no change
     )
-    x_properties = dict(add.x_properties)
-    raw_categories = x_properties.pop("CATEGORIES", None)
+    x_properties, raw_categories = _split_x_properties(add.x_properties)
     metadata_categories = _split_categories_value(raw_categories)
     metadata_provided = raw_categories is not None
     existing_categories = existing.data.categories if existing else None
@@ -243,28 +240,40 @@ async def _sorted_tasks(client: "CalDAVClient") -> list[Task]:
     return sorted(await client.list_tasks(), key=_task_sort_key)
 
 
+_DATETIME_MAX = datetime.max
+# Unprioritised tasks sort after every real priority (1-9)
+_DEFAULT_PRIORITY = 10
+
+
 def _task_sort_key(task: Task) -> tuple[datetime, int, str]:
-    due_key = task.data.due or datetime.max
-    priority_key = task.data.priority if task.data.priority is not None else 10
-    summary_key = task.data.summary.strip().lower() if task.data.summary else ""
-    return due_key, priority_key, summary_key
+    data = task.data
+    priority = data.priority
+    summary = data.summary
+    return (
+        data.due or _DATETIME_MAX,
+        priority if priority is not None else _DEFAULT_PRIORITY,
+        summary.strip().lower() if summary else "",
+    )
+
+
+_ZERO_DELTA = timedelta(0)
 
 
 def _format_due_label(due: datetime | None, now: datetime) -> str:
     if due is None:
         return "--"
     delta = due - now
-    sign = "-" if delta.total_seconds() < 0 else ""
-    delta = abs(delta)
-    if delta.days > 0:
+    if delta < _ZERO_DELTA:
+        sign = "-"
+        delta = -delta
+    else:
+        sign = ""
+    if delta.days:
         return f"{sign}{delta.days}d"
-    hours = delta.seconds // 3600
-    if hours > 0:
+    hours, remainder = divmod(delta.seconds, 3600)
+    if hours:
         return f"{sign}{hours}h"
-    minutes = (delta.seconds % 3600) // 60
-    if minutes > 0:
-        return f"{sign}{minutes}m"
-    return f"{sign}0m"
+    return f"{sign}{remainder // 60}m"
 
 
 SUMMARY_WIDTH = 45
@@ -303,26 +312,78 @@ def _truncate_value(value: str, max_width: int, ellipsize: bool = False) -> str:
 
 
 def _format_project(task: Task) -> str:
-    project = task.data.x_properties.get("X-PROJECT") or task.data.x_properties.get("X-TASKS-ORG-ORDER")
-    return project or "-"
+    x_properties = task.data.x_properties
+    return x_properties.get("X-PROJECT") or x_properties.get("X-TASKS-ORG-ORDER") or "-"
 
 
 def _format_tag(task: Task) -> str:
-    if task.data.categories:
-        return ",".join(task.data.categories)
-    tag = task.data.x_properties.get("X-TAG") or task.data.x_properties.get("X-COLOR")
-    return tag or "-"
+    data = task.data
+    if data.categories:
+        return ",".join(data.categories)
+    x_properties = data.x_properties
+    return x_properties.get("X-TAG") or x_properties.get("X-COLOR") or "-"
 
 
 def _format_due_date(due: datetime | None) -> str:
     if not due:
         return "-"
-    return due.strftime("%Y-%m-%d")
+    return f"{due.year:04d}-{due.month:02d}-{due.day:02d}"
+
+
+def _write_tsv(column_specs: list[ColumnSpec], rows: list[list[str]], title: str | None) -> None:
+    writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+    if title:
+        print(title)
+    writer.writerow([spec.name for spec in column_specs])
+    writer.writerows(rows)
 
 
 def _pretty_print_tasks(
-    tasks: list[Task], show_uids: bool, *, title: str | None = None, reverse: bool = False
+    tasks: list[Task], show_uids: bool, *, title: str | None = None
 ) -> None:
+    """Render tasks as a table; callers pass them already in display order.
+
+    When stdout is not a terminal the rows are written as tab-separated
+    values instead, skipping Rich's layout and styling passes.
+    """
+    column_specs = list(_BASE_COLUMN_SPECS)
+    if show_uids:
+        column_specs.append(_UID_COLUMN_SPEC)
+    limits = [(spec.max_width, spec.ellipsize) for spec in column_specs]
+    column_lengths = [len(spec.name) for spec in column_specs]
+    rows: list[list[str]] = []
+    now = datetime.now()
+    for task in tasks:
+        data = task.data
+        priority = data.priority
+        # Values in _BASE_COLUMN_SPECS order; ID uses the stable task_index
+        values = [
+            str(task.task_index) if task.task_index is not None else "?",
+            _format_due_label(data.due, now),
+            _format_project(task),
+            _format_tag(task),
+            _format_due_date(data.due),
+            data.summary or "",
+            str(priority) if priority is not None else "-",
+        ]
+        if show_uids:
+            values.append(task.uid)
+        row = [
+            value if len(value) <= max_width else _truncate_value(value, max_width, ellipsize)
+            for value, (max_width, ellipsize) in zip(values, limits)
+        ]
+        for position, value in enumerate(row):
+            if len(value) > column_lengths[position]:
+                column_lengths[position] = len(value)
+        rows.append(row)
+    if not sys.stdout.isatty():
+        _write_tsv(column_specs, rows, title)
+        return
+    # Rich is only needed for terminal listings; keep it off the import path otherwise
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console(file=sys.stdout, color_system="auto")
     table = Table(
         title=title,
@@ -333,46 +394,12 @@ def _pretty_print_tasks(
         row_styles=["", "on grey23"],
         padding=(0, 1),
     )
-    column_specs = list(_BASE_COLUMN_SPECS)
-    if show_uids:
-        column_specs.append(_UID_COLUMN_SPEC)
-    column_lengths: dict[str, int] = {spec.name: len(spec.name) for spec in column_specs}
-    rows: list[list[str]] = []
-    now = datetime.now()
-    sorted_tasks = sorted(tasks, key=_task_sort_key, reverse=reverse)
-    for task in sorted_tasks:
-        due_label = _format_due_label(task.data.due, now)
-        project = _format_project(task)
-        tag = _format_tag(task)
-        due_date = _format_due_date(task.data.due)
-        summary = task.data.summary or ""
-        priority_label = str(task.data.priority) if task.data.priority is not None else "-"
-        # Use stable task_index for ID column
-        id_label = str(task.task_index) if task.task_index is not None else "?"
-        values: dict[str, str] = {
-            "ID": id_label,
-            "Age": due_label,
-            "Project": project,
-            "Tag": tag,
-            "Due": due_date,
-            "Description": summary,
-            "Urg": priority_label,
-        }
-        if show_uids:
-            values["UID"] = task.uid
-        row: list[str] = []
-        for spec in column_specs:
-            raw_value = values[spec.name]
-            trimmed = _truncate_value(raw_value, spec.max_width, ellipsize=spec.ellipsize)
-            row.append(trimmed)
-            column_lengths[spec.name] = max(column_lengths[spec.name], len(trimmed))
-        rows.append(row)
-    for spec in column_specs:
+    for spec, min_width in zip(column_specs, column_lengths):
         table.add_column(
             spec.name,
             style=spec.style,
             justify=spec.justify,
-            min_width=column_lengths[spec.name],
+            min_width=min_width,
             max_width=spec.max_width,
             no_wrap=True,
         )
@@ -381,18 +408,15 @@ def _pretty_print_tasks(
     console.print(table)
 
 
-_COMMAND_NAMES = {"add", "complete", "config", "del", "do", "list", "modify", "move", "prioritize", "pull", "push", "show", "start", "stop", "sync", "undo"}
+_COMMAND_NAMES = frozenset({"add", "complete", "config", "del", "do", "list", "modify", "move", "prioritize", "pull", "push", "show", "start", "stop", "sync", "undo"})
 
 
 def _looks_like_index_filter(value: str) -> bool:
     """Check if value looks like numeric indices (e.g., '1,2,3')."""
     if not value:
         return False
-    segments = [segment.strip() for segment in value.split(",")]
-    normalized = [segment for segment in segments if segment]
-    if not normalized:
-        return False
-    return all(segment.isdigit() for segment in normalized)
+    segments = [segment for segment in map(str.strip, value.split(",")) if segment]
+    return bool(segments) and all(segment.isdigit() for segment in segments)
 
 
 def _looks_like_metadata_filter(value: str) -> bool:
@@ -483,36 +507,25 @@ def _parse_task_filter(tokens: list[str]) -> TaskFilter | None:
     return TaskFilter(project=project, tags=tags, indices=indices)
 
 
-def _parse_filter_indices(raw: str | None) -> list[str] | None:
-    if raw is None:
-        return None
-    tokens = [segment.strip() for segment in raw.split(",")]
-    normalized = [token for token in tokens if token]
-    for token in normalized:
-        if not token.isdigit():
-            _exit_with_message(f"invalid filter token: {token}")
-    return normalized
-
-
-def _effective_filter_indices(indices: list[str] | None) -> list[str]:
+def _effective_filter_indices(indices: list[int] | None) -> list[int]:
     if indices is None:
         return []
     return indices
 
 
-def _select_tasks_for_filter(tasks: list[Task], indices: list[str]) -> list[Task]:
+def _select_tasks_for_filter(tasks: list[Task], indices: list[int]) -> list[Task]:
+    """Pick tasks by stable index; ``tasks`` must already be sorted."""
     if not tasks:
         return []
-    sorted_tasks = sorted(tasks, key=_task_sort_key)
     if not indices:
-        return list(sorted_tasks)
+        return list(tasks)
     # Use stable task_index for filtering
-    index_map = {str(task.task_index): task for task in tasks if task.task_index is not None}
+    index_map = {task.task_index: task for task in tasks if task.task_index is not None}
     selected: list[Task] = []
-    for token in indices:
-        task = index_map.get(token)
+    for index in indices:
+        task = index_map.get(index)
         if task is None:
-            _exit_with_message(f"filter {token} did not match any task")
+            _exit_with_message(f"filter {index} did not match any task")
         selected.append(task)
     return selected
 
@@ -576,28 +589,31 @@ async def _handle_modify(args: argparse.Namespace) -> None:
         )
         if not tasks:
             _exit_with_message("no tasks match filter")
-        diffs: dict[int, TaskDiff] = {}
-        index_to_uid: dict[int, str] = {}
-        for task in tasks:
-            patch = _build_patch_from_descriptor(descriptor, task)
-            if not _has_changes(patch):
-                continue
-            updated = await client.modify_task(task, patch)
-            diffs[task.task_index] = TaskDiff(pre=task.data, post=updated.data)
-            index_to_uid[task.task_index] = task.uid
-        if not diffs:
-            _exit_with_message("no changes provided")
-        result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
-        print(result.pretty())
-
-        # Log transaction
-        if not result.is_empty and client.cache:
-            uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
-            await client.cache.log_transaction(
-                uid_diff,
-                operation="modify",
-                max_entries=client.config.cache.transaction_log_size,
-            )
+        # One cache transaction for every task touched by the command
+        async with client.batch():
+            diffs: dict[int, TaskDiff] = {}
+            index_to_uid: dict[int, str] = {}
+            dates = _resolve_patch_dates(descriptor)
+            for task in tasks:
+                patch = _build_patch_from_descriptor(descriptor, task, dates)
+                if not _has_changes(patch):
+                    continue
+                updated = await client.modify_task(task, patch)
+                diffs[task.task_index] = TaskDiff(pre=task.data, post=updated.data)
+                index_to_uid[task.task_index] = task.uid
+            if not diffs:
+                _exit_with_message("no changes provided")
+            result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
+            print(result.pretty())
+
+            # Log transaction
+            if not result.is_empty and client.cache:
+                uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
+                await client.cache.log_transaction(
+                    uid_diff,
+                    operation="modify",
+                    max_entries=client.config.cache.transaction_log_size,
+                )
     finally:
         await client.close()
 
@@ -611,34 +627,36 @@ async def _handle_do(args: argparse.Namespace) -> None:
         )
         if not tasks:
             _exit_with_message("no tasks match filter")
-        diffs: dict[int, TaskDiff] = {}
-        index_to_uid: dict[int, str] = {}
-        for task in tasks:
-            # Use complete_task to move task to completed_tasks table
-            await client.complete_task(task.uid)
-            # Build diff with original data -> completed status
-            completed_data = TaskData(
-                summary=task.data.summary,
-                status="COMPLETED",
-                due=task.data.due,
-                wait=task.data.wait,
-                priority=task.data.priority,
-                x_properties=task.data.x_properties,
-                categories=task.data.categories,
-            )
-            diffs[task.task_index] = TaskDiff(pre=task.data, post=completed_data)
-            index_to_uid[task.task_index] = task.uid
-        result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
-        print(result.pretty())
-
-        # Log transaction
-        if not result.is_empty and client.cache:
-            uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
-            await client.cache.log_transaction(
-                uid_diff,
-                operation="do",
-                max_entries=client.config.cache.transaction_log_size,
-            )
+        # One cache transaction for every task touched by the command
+        async with client.batch():
+            diffs: dict[int, TaskDiff] = {}
+            index_to_uid: dict[int, str] = {}
+            for task in tasks:
+                # Use complete_task to move task to completed_tasks table
+                await client.complete_task(task.uid)
+                # Build diff with original data -> completed status
+                completed_data = TaskData(
+                    summary=task.data.summary,
+                    status="COMPLETED",
+                    due=task.data.due,
+                    wait=task.data.wait,
+                    priority=task.data.priority,
+                    x_properties=task.data.x_properties,
+                    categories=task.data.categories,
+                )
+                diffs[task.task_index] = TaskDiff(pre=task.data, post=completed_data)
+                index_to_uid[task.task_index] = task.uid
+            result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
+            print(result.pretty())
+
+            # Log transaction
+            if not result.is_empty and client.cache:
+                uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
+                await client.cache.log_transaction(
+                    uid_diff,
+                    operation="do",
+                    max_entries=client.config.cache.transaction_log_size,
+                )
     finally:
         await client.close()
 
@@ -654,23 +672,25 @@ async def _change_status(args: argparse.Namespace, status: str, operation: str)
         )
         if not tasks:
             _exit_with_message("no tasks match filter")
-        diffs: dict[int, TaskDiff] = {}
-        index_to_uid: dict[int, str] = {}
-        for task in tasks:
-            updated = await client.modify_task(task, patch)
-            diffs[task.task_index] = TaskDiff(pre=task.data, post=updated.data)
-            index_to_uid[task.task_index] = task.uid
-        result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
-        print(result.pretty())
-
-        # Log transaction
-        if not result.is_empty and client.cache:
-            uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
-            await client.cache.log_transaction(
-                uid_diff,
-                operation=operation,
-                max_entries=client.config.cache.transaction_log_size,
-            )
+        # One cache transaction for every task touched by the command
+        async with client.batch():
+            diffs: dict[int, TaskDiff] = {}
+            index_to_uid: dict[int, str] = {}
+            for task in tasks:
+                updated = await client.modify_task(task, patch)
+                diffs[task.task_index] = TaskDiff(pre=task.data, post=updated.data)
+                index_to_uid[task.task_index] = task.uid
+            result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
+            print(result.pretty())
+
+            # Log transaction
+            if not result.is_empty and client.cache:
+                uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
+                await client.cache.log_transaction(
+                    uid_diff,
+                    operation=operation,
+                    max_entries=client.config.cache.transaction_log_size,
+                )
     finally:
         await client.close()
 
@@ -694,36 +714,39 @@ async def _handle_delete(args: argparse.Namespace) -> None:
         )
         if not tasks:
             _exit_with_message("no tasks match filter")
-        diffs: dict[int, TaskDiff] = {}
-        index_to_uid: dict[int, str] = {}
-        for task in tasks:
-            await client.delete_task(task.uid)
-            diffs[task.task_index] = TaskDiff(pre=task.data, post=None)
-            index_to_uid[task.task_index] = task.uid
-        result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
-        print(result.pretty())
-
-        # Log transaction
-        if not result.is_empty and client.cache:
-            uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
-            await client.cache.log_transaction(
-                uid_diff,
-                operation="delete",
-                max_entries=client.config.cache.transaction_log_size,
-            )
+        # One cache transaction for every task touched by the command
+        async with client.batch():
+            diffs: dict[int, TaskDiff] = {}
+            index_to_uid: dict[int, str] = {}
+            for task in tasks:
+                await client.delete_task(task.uid)
+                diffs[task.task_index] = TaskDiff(pre=task.data, post=None)
+                index_to_uid[task.task_index] = task.uid
+            result: TaskSetDiff[int] = TaskSetDiff(diffs=diffs)
+            print(result.pretty())
+
+            # Log transaction
+            if not result.is_empty and client.cache:
+                uid_diff = result.to_uid_keyed(lambda idx: index_to_uid.get(idx, str(idx)))
+                await client.cache.log_transaction(
+                    uid_diff,
+                    operation="delete",
+                    max_entries=client.config.cache.transaction_log_size,
+                )
     finally:
         await client.close()
 
 
 async def _handle_list(args: argparse.Namespace) -> None:
     config = _resolve_config(args.env)
-    client = await _cache_client(args.env)
+    client = await _cache_client(args.env, config)
     try:
         task_filter = getattr(args, "task_filter", None)
         # Use SQL-based filtering that excludes waiting tasks
         tasks = await client.list_active_tasks(
             exclude_waiting=True,
             task_filter=task_filter,
+            projection=LISTING_COLUMNS,
         )
         if not tasks:
             if task_filter:
@@ -738,25 +761,27 @@ async def _handle_list(args: argparse.Namespace) -> None:
             print("no tasks match filter")
             return
 
+        reverse = not getattr(args, "no_reverse", False)
+        # Sort once; the status partitions below keep this order
+        active_tasks.sort(key=_task_sort_key, reverse=reverse)
+
         # Split tasks by status: IN-PROCESS (started) and NEEDS-ACTION (backlog)
         started = [t for t in active_tasks if t.data.status == "IN-PROCESS"]
         backlog = [t for t in active_tasks if t.data.status == "NEEDS-ACTION"]
         other = [t for t in active_tasks if t.data.status not in ("IN-PROCESS", "NEEDS-ACTION", "COMPLETED")]
 
-        reverse = not getattr(args, "no_reverse", False)
-
         # Display order: Backlog first, then Started (so Started appears at bottom)
         if backlog:
-            _pretty_print_tasks(backlog, config.show_uids, title="Backlog", reverse=reverse)
+            _pretty_print_tasks(backlog, config.show_uids, title="Backlog")
         if started:
             if backlog:
                 print()  # Blank line between tables
-            _pretty_print_tasks(started, config.show_uids, title="Started", reverse=reverse)
+            _pretty_print_tasks(started, config.show_uids, title="Started")
         # Handle tasks with other statuses (if any)
         if other:
             if started or backlog:
                 print()
-            _pretty_print_tasks(other, config.show_uids, title="Other", reverse=reverse)
+            _pretty_print_tasks(other, config.show_uids, title="Other")
     finally:
         await client.close()
 
@@ -764,14 +789,18 @@ async def _handle_list(args: argparse.Namespace) -> None:
 async def _handle_wait(args: argparse.Namespace) -> None:
     """Show tasks with future wait dates."""
     config = _resolve_config(args.env)
-    client = await _cache_client(args.env)
+    client = await _cache_client(args.env, config)
     try:
         task_filter = getattr(args, "task_filter", None)
         # Use SQL-based filtering for waiting tasks
-        waiting_tasks = await client.list_waiting_tasks(task_filter=task_filter)
+        waiting_tasks = await client.list_waiting_tasks(
+            task_filter=task_filter,
+            projection=LISTING_COLUMNS,
+        )
         if not waiting_tasks:
             print("no waiting tasks")
             return
+        waiting_tasks = sorted(waiting_tasks, key=_task_sort_key)
         _pretty_print_tasks(waiting_tasks, config.show_uids, title="Waiting")
     finally:
         await client.close()
@@ -1301,6 +1330,7 @@ def _handle_config_help(args: argparse.Namespace) -> None:
         _exit_with_message("config command requires a subcommand")
 
 
+@functools.cache
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="tdo")
     parser.add_argument(
@@ -1413,7 +1443,23 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _enable_debug_logging() -> None:
+    """Send tdo's own debug records to stderr.
+
+    Only the ``tdo`` logger is configured, so caldav, niquests and urllib3
+    stay at their defaults instead of inheriting DEBUG from the root logger.
+    """
+    tdo_logger = logging.getLogger("tdo")
+    tdo_logger.setLevel(logging.DEBUG)
+    if not tdo_logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+        tdo_logger.addHandler(handler)
+
+
 async def _async_main(argv: Sequence[str] | None = None) -> int:
+    if _parse_bool_like(os.environ.get("TDO_DEBUG")):
+        _enable_debug_logging()
     input_args = list(argv if argv is not None else sys.argv[1:])
     filter_tokens, command_tokens = _split_filter_and_command(input_args)
     parser = _build_parser()
@@ -1428,7 +1474,7 @@ async def _async_main(argv: Sequence[str] | None = None) -> int:
     args.task_filter = _parse_task_filter(filter_tokens)
     # Backward compatibility: extract indices for commands that use filter_indices
     if args.task_filter and args.task_filter.indices:
-        args.filter_indices = [str(i) for i in args.task_filter.indices]
+        args.filter_indices = args.task_filter.indices
     else:
         args.filter_indices = None
     handler = getattr(args, "func", None)
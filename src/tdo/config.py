@@ -114,10 +114,22 @@ def _parse_toml_file(path: Path) -> dict[str, Union[str, bool, int]]:
     return result
 
 
+# Parsed config files keyed on path, invalidated by (mtime_ns, size)
+_FILE_VALUES_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Union[str, bool, int]]]] = {}
+
+
 def _load_file_values(path: Path) -> dict[str, Union[str, bool, int]]:
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_VALUES_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
     if path.suffix == ".toml":
-        return _parse_toml_file(path)
-    return dict(_parse_config_file(path))
+        values = _parse_toml_file(path)
+    else:
+        values = dict(_parse_config_file(path))
+    _FILE_VALUES_CACHE[path] = (stamp, values)
+    return dict(values)
 
 
 def _retrieve_password_from_keyring(service: str, username: str) -> str | None:
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Generic, Mapping, Sequence, TypeVar
 
 from .models import Attachment, Task, TaskData
+from .sqlite_cache import _encode_json
 
 if TYPE_CHECKING:
     from .sqlite_cache import SqliteTaskCache
@@ -208,6 +209,9 @@ class TaskSetDiff(Generic[K]):
         """
         statements: list[tuple[str, tuple]] = []
 
+        # Rows rewritten here no longer match the server copy their etag
+        # describes, so every statement clears it; otherwise a pull would
+        # trust the etag and keep the rewritten row instead of refetching.
         for uid, diff in self.diffs.items():
             if not isinstance(uid, str):
                 raise TypeError(f"as_sql requires str keys (uid), got {type(uid)}")
@@ -239,7 +243,8 @@ class TaskSetDiff(Generic[K]):
                             url = excluded.url,
                             attachments = excluded.attachments,
                             updated_at = excluded.updated_at,
-                            completed_at = excluded.completed_at
+                            completed_at = excluded.completed_at,
+                            etag = NULL
                     """
                     now = datetime.now().timestamp()
                     params = (
@@ -274,7 +279,8 @@ class TaskSetDiff(Generic[K]):
                             categories = excluded.categories,
                             url = excluded.url,
                             attachments = excluded.attachments,
-                            updated_at = excluded.updated_at
+                            updated_at = excluded.updated_at,
+                            etag = NULL
                     """
                     params = (
                         uid,
@@ -309,7 +315,8 @@ class TaskSetDiff(Generic[K]):
                         categories = ?,
                         url = ?,
                         attachments = ?,
-                        updated_at = ?
+                        updated_at = ?,
+                        etag = NULL
                     WHERE uid = ?
                 """
                 params = (
@@ -439,7 +446,7 @@ class TaskSetDiff(Generic[K]):
         Keys are converted to strings for JSON compatibility.
         """
         payload = {str(k): v.to_dict() for k, v in self.diffs.items()}
-        return json.dumps(payload)
+        return _encode_json(payload)
 
     @classmethod
     def from_json(cls, data: str) -> TaskSetDiff[str]:
@@ -452,21 +459,21 @@ class TaskSetDiff(Generic[K]):
         return cls(diffs=diffs)
 
 
-def _serialize_map(value: dict[str, str] | None) -> str:
-    """Serialize a dict to JSON string."""
-    return json.dumps(value or {})
+def _serialize_map(value: dict[str, str] | None) -> str | None:
+    """Serialize a dict to JSON string (NULL when empty, as the cache does)."""
+    return _encode_json(value) if value else None
 
 
-def _serialize_list(value: list[str] | None) -> str:
-    """Serialize a list to JSON string."""
-    return json.dumps(list(value or []))
+def _serialize_list(value: list[str] | None) -> str | None:
+    """Serialize a list to JSON string (NULL when empty)."""
+    return _encode_json(list(value)) if value else None
 
 
-def _serialize_attachments(attachments: list[Attachment] | None) -> str:
-    """Serialize attachments to JSON string."""
+def _serialize_attachments(attachments: list[Attachment] | None) -> str | None:
+    """Serialize attachments to JSON string (NULL when empty)."""
     if not attachments:
-        return "[]"
-    return json.dumps([{"uri": a.uri, "fmttype": a.fmttype} for a in attachments])
+        return None
+    return _encode_json([{"uri": a.uri, "fmttype": a.fmttype} for a in attachments])
 
 
 def _to_utc_timestamp(dt: datetime | None) -> float | None:
@@ -8,7 +8,7 @@ from typing import Any, Dict, Generic, Optional, TypeVar
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     """Represents a CalDAV ATTACH property."""
 
@@ -23,7 +23,7 @@ class Attachment:
         return cls(uri=data["uri"], fmttype=data.get("fmttype"))
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskData(Generic[T]):
     summary: str | None = None
     status: str | None = None
@@ -76,12 +76,13 @@ class TaskData(Generic[T]):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     uid: str
     data: TaskData[datetime]
     href: str | None = None
     task_index: int | None = None
+    etag: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize Task to a JSON-compatible dict."""
@@ -90,6 +91,7 @@ class Task:
             "data": self.data.to_dict(),
             "href": self.href,
             "task_index": self.task_index,
+            "etag": self.etag,
         }
 
     @classmethod
@@ -100,6 +102,7 @@ class Task:
             data=TaskData.from_dict(data["data"]),
             href=data.get("href"),
             task_index=data.get("task_index"),
+            etag=data.get("etag"),
         )
 
 
@@ -107,7 +110,7 @@ TaskPayload = TaskData[datetime]
 TaskPatch = TaskData[datetime]
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskFilter:
     project: str | None = None
     tags: list[str] = field(default_factory=list)
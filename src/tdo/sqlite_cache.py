@@ -4,10 +4,11 @@ import asyncio
 import json
 import os
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
 
 import aiosqlite
 
@@ -32,25 +33,78 @@ class TransactionLogEntry:
     created_at: float
 
 
-def _serialize_properties(value: Sequence[str] | None) -> str:
-    return json.dumps(list(value or []))
+# Columns a task table listing reads.  url, attachments, href and etag are
+# left out so listings skip decoding the attachments JSON.
+LISTING_COLUMNS: tuple[str, ...] = (
+    "uid",
+    "summary",
+    "status",
+    "due",
+    "wait",
+    "priority",
+    "x_properties",
+    "categories",
+    "task_index",
+)
+
+_TASK_COLUMNS = frozenset(
+    {
+        "uid", "summary", "status", "due", "wait", "priority", "x_properties",
+        "categories", "url", "attachments", "href", "etag", "task_index",
+    }
+)
+
+
+def _select_list(columns: Sequence[str] | None) -> str:
+    if columns is None:
+        return "*"
+    unknown = set(columns) - _TASK_COLUMNS
+    if unknown:
+        raise ValueError(f"unknown task columns: {', '.join(sorted(unknown))}")
+    if "uid" not in columns:
+        columns = ("uid", *columns)
+    return ", ".join(columns)
+
+
+def _parse_datetime(raw: str | None) -> datetime | None:
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
 
+# Compact, non-ASCII-escaping JSON for the TEXT columns and the transaction
+# log (diff.py imports it, so both encode identically).  Still valid JSON, so
+# json_extract() and the LIKE tag filters keep working.  Built once because
+# json.dumps() constructs a fresh encoder whenever it gets non-default options.
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+# The matching decoder, bound once so reads skip json.loads' argument checks
+_decode_json = json.JSONDecoder().decode
 
-def _serialize_map(value: dict[str, str] | None) -> str:
-    return json.dumps(value or {})
 
+# Empty collections are stored as NULL: the readers already map a missing
+# value to an empty container, and json_extract()/LIKE treat NULL as no match.
+def _serialize_properties(value: Sequence[str] | None) -> str | None:
+    return _encode_json(list(value)) if value else None
 
-def _serialize_attachments(attachments: list[Attachment] | None) -> str:
+
+def _serialize_map(value: dict[str, str] | None) -> str | None:
+    return _encode_json(value) if value else None
+
+
+def _serialize_attachments(attachments: list[Attachment] | None) -> str | None:
     if not attachments:
-        return "[]"
-    return json.dumps([{"uri": a.uri, "fmttype": a.fmttype} for a in attachments])
+        return None
+    return _encode_json([{"uri": a.uri, "fmttype": a.fmttype} for a in attachments])
 
 
 def _parse_attachments(raw: str | None) -> list[Attachment]:
-    if not raw:
+    if not raw or raw == "[]":
         return []
     try:
-        payload = json.loads(raw)
+        payload = _decode_json(raw)
     except json.JSONDecodeError:
         return []
     if not isinstance(payload, list):
@@ -63,10 +117,10 @@ def _parse_attachments(raw: str | None) -> list[Attachment]:
 
 
 def _parse_json(raw: str | None) -> dict[str, str]:
-    if not raw:
+    if not raw or raw == "{}":
         return {}
     try:
-        payload = json.loads(raw)
+        payload = _decode_json(raw)
     except json.JSONDecodeError:
         return {}
     if isinstance(payload, dict):
@@ -75,10 +129,10 @@ def _parse_json(raw: str | None) -> dict[str, str]:
 
 
 def _parse_list(raw: str | None) -> list[str]:
-    if not raw:
+    if not raw or raw == "[]":
         return []
     try:
-        payload = json.loads(raw)
+        payload = _decode_json(raw)
     except json.JSONDecodeError:
         return []
     if isinstance(payload, list):
@@ -93,6 +147,88 @@ def _to_utc_timestamp(dt: datetime | None) -> float | None:
     return dt.timestamp()
 
 
+_UPSERT_TASK_SQL = """
+    INSERT INTO tasks (
+        uid,
+        summary,
+        status,
+        due,
+        wait,
+        due_utc,
+        wait_utc,
+        priority,
+        x_properties,
+        categories,
+        url,
+        attachments,
+        href,
+        etag,
+        pending_action,
+        last_synced,
+        updated_at,
+        task_index
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(uid) DO UPDATE SET
+        summary = excluded.summary,
+        status = excluded.status,
+        due = excluded.due,
+        wait = excluded.wait,
+        due_utc = excluded.due_utc,
+        wait_utc = excluded.wait_utc,
+        priority = excluded.priority,
+        x_properties = excluded.x_properties,
+        categories = excluded.categories,
+        url = excluded.url,
+        attachments = excluded.attachments,
+        href = excluded.href,
+        etag = excluded.etag,
+        pending_action = CASE
+            WHEN ? THEN NULL
+            ELSE COALESCE(excluded.pending_action, pending_action)
+        END,
+        last_synced = COALESCE(excluded.last_synced, last_synced),
+        updated_at = excluded.updated_at,
+        task_index = COALESCE(excluded.task_index, task_index)
+"""
+
+
+def _upsert_task_params(
+    task: Task,
+    pending_action: str | None,
+    last_synced: float | None,
+    updated_at: float,
+    task_index: int | None,
+    clear_pending: bool,
+) -> tuple[Any, ...]:
+    """Bind parameters for _UPSERT_TASK_SQL.
+
+    On conflict, a None pending_action/last_synced/task_index keeps the
+    stored value, and clear_pending forces pending_action to NULL.
+    """
+    data = task.data
+    return (
+        task.uid,
+        data.summary or task.uid,
+        data.status or "NEEDS-ACTION",
+        data.due.isoformat() if data.due else None,
+        data.wait.isoformat() if data.wait else None,
+        _to_utc_timestamp(data.due),
+        _to_utc_timestamp(data.wait),
+        data.priority,
+        _serialize_map(data.x_properties),
+        _serialize_properties(data.categories),
+        data.url,
+        _serialize_attachments(data.attachments),
+        task.href,
+        task.etag,
+        pending_action,
+        last_synced,
+        updated_at,
+        task_index,
+        clear_pending,
+    )
+
+
 class SqliteTaskCache:
     def __init__(self, path: Path | None = None, *, env: str = "default"):
         resolved = self._resolve_path(path, env)
@@ -100,6 +236,7 @@ class SqliteTaskCache:
         self.path = resolved
         self._conn: aiosqlite.Connection | None = None
         self._index_lock = asyncio.Lock()
+        self._in_transaction = False
 
     @classmethod
     async def create(cls, path: Path | None = None, *, env: str = "default") -> SqliteTaskCache:
@@ -110,8 +247,42 @@ class SqliteTaskCache:
     async def _connect(self) -> None:
         self._conn = await aiosqlite.connect(str(self.path))
         self._conn.row_factory = aiosqlite.Row
+        # WAL lets reads proceed during a pull and only syncs at checkpoints
+        await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute("PRAGMA temp_store=MEMORY")
         await self._ensure_schema()
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into one transaction, committed on exit.
+
+        Writes made inside the block skip their own commit.  Nested blocks
+        join the outermost one.  An exception rolls everything back.
+        """
+        assert self._conn is not None
+        if self._in_transaction:
+            yield
+            return
+        if self._conn.in_transaction:
+            await self._conn.commit()
+        await self._conn.execute("BEGIN IMMEDIATE")
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            await self._conn.rollback()
+            raise
+        else:
+            await self._conn.commit()
+        finally:
+            self._in_transaction = False
+
+    async def _commit(self) -> None:
+        assert self._conn is not None
+        if not self._in_transaction:
+            await self._conn.commit()
+
     async def close(self) -> None:
         if self._conn:
             await self._conn.close()
@@ -157,6 +328,7 @@ class SqliteTaskCache:
             url TEXT,
             attachments TEXT,
             href TEXT,
+            etag TEXT,
             pending_action TEXT,
             last_synced REAL,
             updated_at REAL NOT NULL,
@@ -183,6 +355,7 @@ class SqliteTaskCache:
             url TEXT,
             attachments TEXT,
             href TEXT,
+            etag TEXT,
             pending_action TEXT,
             last_synced REAL,
             updated_at REAL NOT NULL,
@@ -205,6 +378,7 @@ class SqliteTaskCache:
             url TEXT,
             attachments TEXT,
             href TEXT,
+            etag TEXT,
             last_synced REAL,
             deleted_at REAL NOT NULL,
             task_index INTEGER
@@ -217,10 +391,15 @@ class SqliteTaskCache:
             created_at REAL NOT NULL
         );
         CREATE INDEX IF NOT EXISTS idx_transaction_log_created ON transaction_log(created_at);
+
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
         """
         assert self._conn is not None
         await self._conn.executescript(script)
-        await self._conn.commit()
+        await self._commit()
         await self._migrate_schema()
 
     async def _migrate_schema(self) -> None:
@@ -231,11 +410,11 @@ class SqliteTaskCache:
             await self._conn.execute(
                 "ALTER TABLE tasks ADD COLUMN task_index INTEGER UNIQUE"
             )
-            await self._conn.commit()
+            await self._commit()
             await self._assign_indices_to_existing_tasks()
         if "wait" not in columns:
             await self._conn.execute("ALTER TABLE tasks ADD COLUMN wait TEXT")
-            await self._conn.commit()
+            await self._commit()
 
         # Migration: move deleted=1 rows to deleted_tasks, completed to completed_tasks
         if "deleted" in columns:
@@ -249,7 +428,7 @@ class SqliteTaskCache:
             await self._conn.execute("ALTER TABLE completed_tasks ADD COLUMN wait_utc REAL")
             await self._conn.execute("ALTER TABLE deleted_tasks ADD COLUMN due_utc REAL")
             await self._conn.execute("ALTER TABLE deleted_tasks ADD COLUMN wait_utc REAL")
-            await self._conn.commit()
+            await self._commit()
             await self._backfill_utc_columns()
 
         # Migration: add url and attachments columns
@@ -260,7 +439,14 @@ class SqliteTaskCache:
             await self._conn.execute("ALTER TABLE completed_tasks ADD COLUMN attachments TEXT")
             await self._conn.execute("ALTER TABLE deleted_tasks ADD COLUMN url TEXT")
             await self._conn.execute("ALTER TABLE deleted_tasks ADD COLUMN attachments TEXT")
-            await self._conn.commit()
+            await self._commit()
+
+        # Migration: add etag columns for conditional pulls and deletes
+        for table in ("tasks", "completed_tasks", "deleted_tasks"):
+            cursor = await self._conn.execute(f"PRAGMA table_info({table})")
+            if "etag" not in {row[1] for row in await cursor.fetchall()}:
+                await self._conn.execute(f"ALTER TABLE {table} ADD COLUMN etag TEXT")
+                await self._commit()
 
     async def _migrate_to_three_tables(self) -> None:
         """Migrate from single tasks table with deleted flag to three tables."""
@@ -346,12 +532,12 @@ class SqliteTaskCache:
         await self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_dirty ON tasks(pending_action)")
         await self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_index ON tasks(task_index)")
 
-        await self._conn.commit()
+        await self._commit()
 
     async def _assign_indices_to_existing_tasks(self) -> None:
         assert self._conn is not None
         cursor = await self._conn.execute(
-            "SELECT uid FROM tasks WHERE deleted = 0 ORDER BY due IS NULL, due, summary"
+            "SELECT uid FROM tasks WHERE deleted = 0 ORDER BY due NULLS LAST, summary"
         )
         rows = await cursor.fetchall()
         for idx, row in enumerate(rows, start=1):
@@ -359,7 +545,7 @@ class SqliteTaskCache:
                 "UPDATE tasks SET task_index = ? WHERE uid = ?",
                 (idx, row[0])
             )
-        await self._conn.commit()
+        await self._commit()
 
     async def _backfill_utc_columns(self) -> None:
         """Backfill due_utc and wait_utc from existing TEXT columns."""
@@ -396,7 +582,7 @@ class SqliteTaskCache:
                         (due_utc, wait_utc, uid)
                     )
 
-        await self._conn.commit()
+        await self._commit()
 
     async def _next_available_index(self) -> int:
         """Find smallest hole or increment max."""
@@ -433,7 +619,7 @@ class SqliteTaskCache:
                 "UPDATE tasks SET task_index = ? WHERE uid = ?",
                 (index, uid)
             )
-            await self._conn.commit()
+            await self._commit()
             return index
 
     async def get_task_by_index(self, index: int) -> Task | None:
@@ -449,7 +635,7 @@ class SqliteTaskCache:
     async def list_tasks(self) -> list[Task]:
         assert self._conn is not None
         async with self._conn.execute(
-            "SELECT * FROM tasks ORDER BY due IS NULL, due"
+            "SELECT * FROM tasks ORDER BY due NULLS LAST"
         ) as cursor:
             rows = await cursor.fetchall()
         return [self._build_task(row) for row in rows]
@@ -475,7 +661,7 @@ class SqliteTaskCache:
             where = " WHERE " + " AND ".join(conditions)
         else:
             where = ""
-        query = f"SELECT * FROM tasks{where} ORDER BY due IS NULL, due"
+        query = f"SELECT * FROM tasks{where} ORDER BY due NULLS LAST"
 
         async with self._conn.execute(query, params) as cursor:
             rows = await cursor.fetchall()
@@ -486,10 +672,12 @@ class SqliteTaskCache:
         *,
         exclude_waiting: bool = True,
         task_filter: TaskFilter | None = None,
+        columns: Sequence[str] | None = None,
     ) -> list[Task]:
         """List active (non-completed, non-waiting) tasks with optional filters.
 
-        Uses UTC columns for date comparisons.
+        Uses UTC columns for date comparisons.  When ``columns`` is given only
+        those columns are read; the other task fields are left empty.
         """
         assert self._conn is not None
         conditions: list[str] = []
@@ -515,11 +703,15 @@ class SqliteTaskCache:
                 params.extend(str(i) for i in task_filter.indices)
 
         where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
-        query = f"SELECT * FROM tasks{where_clause} ORDER BY due_utc IS NULL, due_utc"
+        query = (
+            f"SELECT {_select_list(columns)} FROM tasks{where_clause}"
+            " ORDER BY due_utc NULLS LAST"
+        )
 
         async with self._conn.execute(query, params) as cursor:
             rows = await cursor.fetchall()
-        return [self._build_task(row) for row in rows]
+        build = self._build_task if columns is None else self._build_projected_task
+        return [build(row) for row in rows]
 
     async def list_unprioritized_tasks(
         self,
@@ -551,7 +743,7 @@ class SqliteTaskCache:
                 params.extend(str(i) for i in task_filter.indices)
 
         where_clause = " WHERE " + " AND ".join(conditions)
-        query = f"SELECT * FROM tasks{where_clause} ORDER BY due_utc IS NULL, due_utc"
+        query = f"SELECT * FROM tasks{where_clause} ORDER BY due_utc NULLS LAST"
 
         async with self._conn.execute(query, params) as cursor:
             rows = await cursor.fetchall()
@@ -561,8 +753,9 @@ class SqliteTaskCache:
         self,
         *,
         task_filter: TaskFilter | None = None,
+        columns: Sequence[str] | None = None,
     ) -> list[Task]:
-        """List tasks with future wait dates."""
+        """List tasks with future wait dates, optionally reading only ``columns``."""
         assert self._conn is not None
         now_utc = time.time()
         conditions: list[str] = ["wait_utc IS NOT NULL", "wait_utc > ?"]
@@ -581,11 +774,12 @@ class SqliteTaskCache:
                 params.extend(str(i) for i in task_filter.indices)
 
         where_clause = " WHERE " + " AND ".join(conditions)
-        query = f"SELECT * FROM tasks{where_clause} ORDER BY wait_utc"
+        query = f"SELECT {_select_list(columns)} FROM tasks{where_clause} ORDER BY wait_utc"
 
         async with self._conn.execute(query, params) as cursor:
             rows = await cursor.fetchall()
-        return [self._build_task(row) for row in rows]
+        build = self._build_task if columns is None else self._build_projected_task
+        return [build(row) for row in rows]
 
     async def dirty_tasks(self) -> list[DirtyTask]:
         """Return all tasks with pending changes to sync.
@@ -646,53 +840,54 @@ class SqliteTaskCache:
         timestamp = time.time()
         assert self._conn is not None
 
-        # Preserve existing indices for tasks we're updating (from both tables)
-        cursor = await self._conn.execute(
-            "SELECT uid, task_index FROM tasks WHERE task_index IS NOT NULL"
-        )
-        existing_indices = {row[0]: row[1] for row in await cursor.fetchall()}
+        # One transaction for the whole swap instead of a commit per row
+        async with self.transaction():
+            # Preserve existing indices for tasks we're updating (from both tables)
+            cursor = await self._conn.execute(
+                "SELECT uid, task_index FROM tasks WHERE task_index IS NOT NULL"
+            )
+            existing_indices = {row[0]: row[1] for row in await cursor.fetchall()}
 
-        # Also check completed_tasks for preserved indices
-        cursor = await self._conn.execute(
-            "SELECT uid, task_index FROM completed_tasks WHERE task_index IS NOT NULL"
-        )
-        existing_indices.update({row[0]: row[1] for row in await cursor.fetchall()})
-
-        # Delete non-pending tasks from both tables
-        await self._conn.execute("DELETE FROM tasks WHERE pending_action IS NULL")
-        await self._conn.execute("DELETE FROM completed_tasks WHERE pending_action IS NULL")
-        await self._conn.commit()
-
-        # Track which active tasks need new indices
-        tasks_needing_indices: list[str] = []
-
-        for task in tasks:
-            preserved_index = existing_indices.get(task.uid)
-
-            if task.data.status == "COMPLETED":
-                # Insert into completed_tasks
-                await self._insert_completed_task(
-                    task,
-                    pending_action=None,
-                    last_synced=timestamp,
-                    completed_at=timestamp,
-                    task_index=preserved_index,
-                )
-            else:
-                # Insert into active tasks
-                await self._insert_or_update(
-                    task,
-                    pending_action=None,
-                    last_synced=timestamp,
-                    clear_pending=True,
-                    task_index=preserved_index,
-                )
-                if preserved_index is None:
-                    tasks_needing_indices.append(task.uid)
-
-        # Assign indices to new active tasks
-        for uid in tasks_needing_indices:
-            await self.assign_index(uid)
+            # Also check completed_tasks for preserved indices
+            cursor = await self._conn.execute(
+                "SELECT uid, task_index FROM completed_tasks WHERE task_index IS NOT NULL"
+            )
+            existing_indices.update({row[0]: row[1] for row in await cursor.fetchall()})
+
+            # Delete non-pending tasks from both tables
+            await self._conn.execute("DELETE FROM tasks WHERE pending_action IS NULL")
+            await self._conn.execute("DELETE FROM completed_tasks WHERE pending_action IS NULL")
+
+            # Track which active tasks need new indices
+            tasks_needing_indices: list[str] = []
+            # Active rows go in one executemany
+            active_rows: list[tuple[Any, ...]] = []
+
+            for task in tasks:
+                preserved_index = existing_indices.get(task.uid)
+
+                if task.data.status == "COMPLETED":
+                    # Insert into completed_tasks
+                    await self._insert_completed_task(
+                        task,
+                        pending_action=None,
+                        last_synced=timestamp,
+                        completed_at=timestamp,
+                        task_index=preserved_index,
+                    )
+                else:
+                    active_rows.append(
+                        _upsert_task_params(task, None, timestamp, timestamp, preserved_index, True)
+                    )
+                    if preserved_index is None:
+                        tasks_needing_indices.append(task.uid)
+
+            if active_rows:
+                await self._conn.executemany(_UPSERT_TASK_SQL, active_rows)
+
+            # Assign indices to new active tasks
+            for uid in tasks_needing_indices:
+                await self.assign_index(uid)
 
     async def upsert_task(
         self,
@@ -711,10 +906,34 @@ class SqliteTaskCache:
             task_index=task_index,
         )
 
+    async def upsert_many(self, tasks: Sequence[Task], *, last_synced: float) -> None:
+        """Store tasks confirmed by the server and clear their pending actions.
+
+        Completed tasks go to completed_tasks, everything else to tasks. All
+        rows are written in a single transaction.
+        """
+        async with self.transaction():
+            for task in tasks:
+                if task.data.status == "COMPLETED":
+                    await self._insert_completed_task(
+                        task,
+                        pending_action=None,
+                        last_synced=last_synced,
+                        completed_at=last_synced,
+                        task_index=task.task_index,
+                    )
+                else:
+                    await self._insert_or_update(
+                        task,
+                        pending_action=None,
+                        last_synced=last_synced,
+                        clear_pending=True,
+                    )
+
     async def delete_task(self, uid: str) -> None:
         assert self._conn is not None
         await self._conn.execute("DELETE FROM tasks WHERE uid = ?", (uid,))
-        await self._conn.commit()
+        await self._commit()
 
     async def get_task(self, uid: str) -> Task | None:
         assert self._conn is not None
@@ -742,96 +961,20 @@ class SqliteTaskCache:
         task_index: int | None = None,
     ) -> None:
         """Insert or update a task in the active tasks table."""
-        summary = task.data.summary or task.uid
-        status = task.data.status or "NEEDS-ACTION"
-        due_value = task.data.due.isoformat() if task.data.due else None
-        wait_value = task.data.wait.isoformat() if task.data.wait else None
-        due_utc = _to_utc_timestamp(task.data.due)
-        wait_utc = _to_utc_timestamp(task.data.wait)
-        priority = task.data.priority
-        x_props = _serialize_map(task.data.x_properties)
-        categories = _serialize_properties(task.data.categories)
-        url = task.data.url
-        attachments = _serialize_attachments(task.data.attachments)
-        href = task.href
         assert self._conn is not None
-        async with self._conn.execute(
-            "SELECT pending_action, last_synced, task_index FROM tasks WHERE uid = ?",
-            (task.uid,)
-        ) as cursor:
-            existing = await cursor.fetchone()
-        if clear_pending:
-            resolved_pending = None
-        elif pending_action is not None:
-            resolved_pending = pending_action
-        else:
-            resolved_pending = existing["pending_action"] if existing else None
-        resolved_last_synced = last_synced if last_synced is not None else (existing["last_synced"] if existing else None)
-        # Preserve existing index if not explicitly provided
-        resolved_index = task_index if task_index is not None else (existing["task_index"] if existing else None)
-        now = time.time()
+        # The conflict clause merges with the stored row; no read needed first
         await self._conn.execute(
-            """
-            INSERT INTO tasks (
-                uid,
-                summary,
-                status,
-                due,
-                wait,
-                due_utc,
-                wait_utc,
-                priority,
-                x_properties,
-                categories,
-                url,
-                attachments,
-                href,
-                pending_action,
+            _UPSERT_TASK_SQL,
+            _upsert_task_params(
+                task,
+                None if clear_pending else pending_action,
                 last_synced,
-                updated_at,
-                task_index
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(uid) DO UPDATE SET
-                summary = excluded.summary,
-                status = excluded.status,
-                due = excluded.due,
-                wait = excluded.wait,
-                due_utc = excluded.due_utc,
-                wait_utc = excluded.wait_utc,
-                priority = excluded.priority,
-                x_properties = excluded.x_properties,
-                categories = excluded.categories,
-                url = excluded.url,
-                attachments = excluded.attachments,
-                href = excluded.href,
-                pending_action = ?,
-                last_synced = ?,
-                updated_at = excluded.updated_at,
-                task_index = COALESCE(excluded.task_index, task_index)
-            """,
-            (
-                task.uid,
-                summary,
-                status,
-                due_value,
-                wait_value,
-                due_utc,
-                wait_utc,
-                priority,
-                x_props,
-                categories,
-                url,
-                attachments,
-                href,
-                resolved_pending,
-                resolved_last_synced,
-                now,
-                resolved_index,
-                resolved_pending,
-                resolved_last_synced,
+                time.time(),
+                task_index,
+                clear_pending,
             ),
         )
-        await self._conn.commit()
+        await self._commit()
 
     async def _insert_completed_task(
         self,
@@ -873,12 +1016,13 @@ class SqliteTaskCache:
                 url,
                 attachments,
                 href,
+                etag,
                 pending_action,
                 last_synced,
                 updated_at,
                 completed_at,
                 task_index
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(uid) DO UPDATE SET
                 summary = excluded.summary,
                 status = excluded.status,
@@ -892,6 +1036,7 @@ class SqliteTaskCache:
                 url = excluded.url,
                 attachments = excluded.attachments,
                 href = excluded.href,
+                etag = excluded.etag,
                 pending_action = excluded.pending_action,
                 last_synced = excluded.last_synced,
                 updated_at = excluded.updated_at,
@@ -912,6 +1057,7 @@ class SqliteTaskCache:
                 url,
                 attachments,
                 href,
+                task.etag,
                 pending_action,
                 last_synced,
                 now,
@@ -919,7 +1065,7 @@ class SqliteTaskCache:
                 task_index,
             ),
         )
-        await self._conn.commit()
+        await self._commit()
 
     async def _insert_deleted_task(
         self,
@@ -957,10 +1103,11 @@ class SqliteTaskCache:
                 url,
                 attachments,
                 href,
+                etag,
                 last_synced,
                 deleted_at,
                 task_index
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(uid) DO UPDATE SET
                 summary = excluded.summary,
                 status = excluded.status,
@@ -974,6 +1121,7 @@ class SqliteTaskCache:
                 url = excluded.url,
                 attachments = excluded.attachments,
                 href = excluded.href,
+                etag = excluded.etag,
                 last_synced = excluded.last_synced,
                 deleted_at = excluded.deleted_at,
                 task_index = COALESCE(excluded.task_index, task_index)
@@ -992,12 +1140,13 @@ class SqliteTaskCache:
                 url,
                 attachments,
                 task.href,
+                task.etag,
                 None,  # last_synced
                 deleted_at,
                 task_index,
             ),
         )
-        await self._conn.commit()
+        await self._commit()
 
     async def complete_task(self, uid: str) -> None:
         """Move a task from tasks to completed_tasks.
@@ -1033,6 +1182,7 @@ class SqliteTaskCache:
             ),
             href=task.href,
             task_index=task.task_index,
+            etag=task.etag,
         )
 
         # If task was never synced (pending create), completion is also a create
@@ -1049,7 +1199,7 @@ class SqliteTaskCache:
 
         # Remove from active tasks
         await self._conn.execute("DELETE FROM tasks WHERE uid = ?", (uid,))
-        await self._conn.commit()
+        await self._commit()
 
     async def mark_for_deletion(self, uid: str) -> None:
         """Move a task to deleted_tasks (pending deletion).
@@ -1073,7 +1223,7 @@ class SqliteTaskCache:
             # If task was never synced, just delete it entirely
             if pending == "create":
                 await self._conn.execute("DELETE FROM tasks WHERE uid = ?", (uid,))
-                await self._conn.commit()
+                await self._commit()
                 return
 
             # Move to deleted_tasks
@@ -1083,7 +1233,7 @@ class SqliteTaskCache:
                 task_index=task.task_index,
             )
             await self._conn.execute("DELETE FROM tasks WHERE uid = ?", (uid,))
-            await self._conn.commit()
+            await self._commit()
             return
 
         # Try completed_tasks
@@ -1099,7 +1249,7 @@ class SqliteTaskCache:
             # If completion was never synced, just delete it entirely
             if pending == "create":
                 await self._conn.execute("DELETE FROM completed_tasks WHERE uid = ?", (uid,))
-                await self._conn.commit()
+                await self._commit()
                 return
 
             # Move to deleted_tasks
@@ -1109,16 +1259,25 @@ class SqliteTaskCache:
                 task_index=task.task_index,
             )
             await self._conn.execute("DELETE FROM completed_tasks WHERE uid = ?", (uid,))
-            await self._conn.commit()
+            await self._commit()
             return
 
         raise KeyError(f"task {uid} not found")
 
-    async def flush_deleted_tasks(self) -> None:
-        """Delete all rows from deleted_tasks table (called after push)."""
+    async def flush_deleted_tasks(self, uids: Sequence[str] | None = None) -> None:
+        """Delete rows from deleted_tasks (called after push).
+
+        With ``uids`` only those rows are flushed, so failed deletes stay
+        pending for the next push.
+        """
         assert self._conn is not None
-        await self._conn.execute("DELETE FROM deleted_tasks")
-        await self._conn.commit()
+        if uids is None:
+            await self._conn.execute("DELETE FROM deleted_tasks")
+        else:
+            await self._conn.executemany(
+                "DELETE FROM deleted_tasks WHERE uid = ?", [(uid,) for uid in uids]
+            )
+        await self._commit()
 
     async def list_completed_tasks(self) -> list[Task]:
         """List all completed tasks."""
@@ -1180,6 +1339,8 @@ class SqliteTaskCache:
             ),
             href=task.href,
             task_index=resolved_index,
+            # No etag: the restored row no longer matches the server copy,
+            # so the next pull must refetch it rather than reuse it
         )
 
         # Insert into active tasks
@@ -1198,7 +1359,7 @@ class SqliteTaskCache:
 
         # Remove from completed_tasks
         await self._conn.execute("DELETE FROM completed_tasks WHERE uid = ?", (uid,))
-        await self._conn.commit()
+        await self._commit()
 
         return restored_task
 
@@ -1226,7 +1387,7 @@ class SqliteTaskCache:
         # Check if original index is available
         resolved_index = await self._try_restore_index(original_index)
 
-        # Restore task
+        # Restore task (without an etag, like restore_from_completed)
         restored_task = Task(
             uid=task.uid,
             data=task.data,
@@ -1250,7 +1411,7 @@ class SqliteTaskCache:
 
         # Remove from deleted_tasks
         await self._conn.execute("DELETE FROM deleted_tasks WHERE uid = ?", (uid,))
-        await self._conn.commit()
+        await self._commit()
 
         return restored_task
 
@@ -1293,6 +1454,28 @@ class SqliteTaskCache:
             row = await cursor.fetchone()
         return self._build_deleted_task(row) if row else None
 
+    async def synced_tasks_by_href(self) -> dict[str, Task]:
+        """Map href to task for rows that mirror the server (no pending action).
+
+        Covers both active and completed tasks that carry an etag, so a pull
+        can reuse them when the server reports the same etag.
+        """
+        assert self._conn is not None
+        result: dict[str, Task] = {}
+        async with self._conn.execute(
+            "SELECT * FROM tasks WHERE pending_action IS NULL AND href IS NOT NULL AND etag IS NOT NULL"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        for row in rows:
+            result[row["href"]] = self._build_task(row)
+        async with self._conn.execute(
+            "SELECT * FROM completed_tasks WHERE pending_action IS NULL AND href IS NOT NULL AND etag IS NOT NULL"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        for row in rows:
+            result[row["href"]] = self._build_completed_task(row)
+        return result
+
     def _build_task(self, row: aiosqlite.Row) -> Task:
         due = None
         due_value = row["due"]
@@ -1323,6 +1506,28 @@ class SqliteTaskCache:
             ),
             href=row["href"],
             task_index=row["task_index"],
+            etag=row["etag"],
+        )
+
+    def _build_projected_task(self, row: aiosqlite.Row) -> Task:
+        """Build a Task from a row holding only some of the task columns."""
+        values = dict(zip(row.keys(), row))
+        return Task(
+            uid=values["uid"],
+            data=TaskData(
+                summary=values.get("summary") or "",
+                status=values.get("status") or "NEEDS-ACTION",
+                due=_parse_datetime(values.get("due")),
+                wait=_parse_datetime(values.get("wait")),
+                priority=values.get("priority"),
+                x_properties=_parse_json(values.get("x_properties")),
+                categories=_parse_list(values.get("categories")),
+                url=values.get("url"),
+                attachments=_parse_attachments(values.get("attachments")),
+            ),
+            href=values.get("href"),
+            task_index=values.get("task_index"),
+            etag=values.get("etag"),
         )
 
     def _build_completed_task(self, row: aiosqlite.Row) -> Task:
@@ -1356,6 +1561,7 @@ class SqliteTaskCache:
             ),
             href=row["href"],
             task_index=row["task_index"],
+            etag=row["etag"],
         )
 
     def _build_deleted_task(self, row: aiosqlite.Row) -> Task:
@@ -1387,8 +1593,9 @@ class SqliteTaskCache:
                 url=row["url"],
                 attachments=_parse_attachments(row["attachments"]),
             ),
-            href=None,  # deleted_tasks doesn't have href
+            href=row["href"],
             task_index=row["task_index"],
+            etag=row["etag"],
         )
 
     async def log_transaction(
@@ -1435,7 +1642,7 @@ class SqliteTaskCache:
             (max_entries,),
         )
 
-        await self._conn.commit()
+        await self._commit()
 
     async def get_transaction_log(
         self,
@@ -1481,7 +1688,7 @@ class SqliteTaskCache:
             count = row[0] if row else 0
 
         await self._conn.execute("DELETE FROM transaction_log")
-        await self._conn.commit()
+        await self._commit()
 
         return count
 
@@ -1509,8 +1716,30 @@ class SqliteTaskCache:
             created_at=row[3],
         )
 
-        # Delete the entry
+        # Delete the entry. Undo may rewrite synced rows, so forget the
+        # calendar ctag to make the next pull refetch instead of short-circuit.
         await self._conn.execute("DELETE FROM transaction_log WHERE id = ?", (entry.id,))
-        await self._conn.commit()
+        await self._conn.execute("DELETE FROM meta WHERE key = 'ctag'")
+        await self._commit()
 
         return entry
+
+    async def get_meta(self, key: str) -> str | None:
+        """Read a value from the cache metadata table."""
+        assert self._conn is not None
+        async with self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def set_meta(self, key: str, value: str | None) -> None:
+        """Store a value in the cache metadata table (None removes it)."""
+        assert self._conn is not None
+        if value is None:
+            await self._conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            await self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+        await self._commit()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import calendar
 import re
+import time
 from datetime import timedelta
 from typing import Callable
 
@@ -91,11 +93,37 @@ def _parse_relative_duration(raw: str) -> timedelta | None:
     return None
 
 
+# monotonic_ns timestamp and arrow.now() value of the last clock read
+_NOW_STAMP: int = 0
+_NOW_VALUE: arrow.Arrow | None = None
+
+
+def _cached_now(ttl_ns: int = 10_000_000) -> arrow.Arrow:
+    """Return arrow.now(), reusing the previous reading for up to ``ttl_ns``.
+
+    Due values resolve at day/hour granularity, so a few milliseconds of slop
+    in "now" is harmless and saves the local-timezone lookup on bulk parses.
+    """
+    global _NOW_STAMP, _NOW_VALUE
+    stamp = time.monotonic_ns()
+    if _NOW_VALUE is not None and stamp - _NOW_STAMP < ttl_ns:
+        return _NOW_VALUE
+    _NOW_STAMP = stamp
+    _NOW_VALUE = arrow.now()
+    return _NOW_VALUE
+
+
+def _reset_now_cache() -> None:
+    global _NOW_STAMP, _NOW_VALUE
+    _NOW_STAMP = 0
+    _NOW_VALUE = None
+
+
 def parse_due_value(raw: str, reference: arrow.Arrow | None = None) -> arrow.Arrow | None:
     candidate = (raw or "").strip()
     if not candidate:
         return None
-    now = reference or arrow.now()
+    now = reference or _cached_now()
     lowered = candidate.lower()
     if lowered in _SPECIAL_DUE_MAPPINGS:
         return _SPECIAL_DUE_MAPPINGS[lowered](now)
@@ -152,19 +180,20 @@ def _previous_month_start(value: arrow.Arrow, target_month: int) -> arrow.Arrow:
     return candidate.floor("day")
 
 
+def _previous_month(year: int, month: int) -> tuple[int, int]:
+    return (year, month - 1) if month > 1 else (year - 1, 12)
+
+
 def _previous_ordinal_day(value: arrow.Arrow, ordinal: int) -> arrow.Arrow:
     if ordinal < 1 or ordinal > 31:
         return value.floor("day")
-    candidate = arrow.get(year=value.year, month=value.month, day=ordinal)
-    if candidate >= value:
-        candidate = candidate.shift(months=-1)
-    while True:
-        try:
-            candidate = arrow.get(year=candidate.year, month=candidate.month, day=ordinal)
-            break
-        except (ValueError, ParserError):
-            candidate = candidate.shift(months=-1)
-    return candidate.floor("day")
+    year, month = value.year, value.month
+    if calendar.monthrange(year, month)[1] < ordinal or arrow.Arrow(year, month, ordinal) >= value:
+        year, month = _previous_month(year, month)
+    # Walk back to the nearest month long enough to contain the ordinal
+    while calendar.monthrange(year, month)[1] < ordinal:
+        year, month = _previous_month(year, month)
+    return arrow.Arrow(year, month, ordinal)
 
 
 def _previous_weekday(value: arrow.Arrow, target: int) -> arrow.Arrow:
@@ -8,7 +8,10 @@ from .models import TaskData
 __all__ = ["UpdateDescriptor"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateDescriptor:
-    add_data: TaskData[str] = field(default_factory=lambda: TaskData[str]())
-    remove_data: TaskData[str] = field(default_factory=lambda: TaskData[str]())
+    # TaskData is mutable, so each descriptor still gets its own default
+    # instance; calling the class directly skips typing's generic-alias
+    # __call__, which is several times slower than the plain constructor.
+    add_data: TaskData[str] = field(default_factory=TaskData)
+    remove_data: TaskData[str] = field(default_factory=TaskData)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from parsimonious.grammar import Grammar
 from parsimonious.nodes import NodeVisitor
 
-from .models import TaskData
+from ._parse_core import ParseState, apply_metadata, build_descriptor
 from .update_descriptor import UpdateDescriptor
 
 
@@ -27,73 +29,42 @@ _UPDATE_GRAMMAR = Grammar(
 )
 
 
-def _parse_priority(raw: str) -> int | None:
-    if not raw:
-        return None
-    candidate = raw.strip().lower()
-    if candidate in {"h", "high"}:
-        return 1
-    if candidate in {"m", "medium"}:
-        return 5
-    if candidate in {"l", "low"}:
-        return 9
-    try:
-        value = int(raw)
-        return value
-    except ValueError:
-        return None
-
-
 class _UpdateVisitor(NodeVisitor):
+    # rule name -> visit_* function, filled in once below the class
+    _DISPATCH: dict[str, Callable[..., Any]] = {}
+
     def __init__(self) -> None:
         super().__init__()
-        self._description_parts: list[str] = []
-        self._additions: list[str] = []
-        self._removals: list[str] = []
-        self.due: str | None = None
-        self.wait: str | None = None
-        self.priority: int | None = None
-        self.status: str | None = None
-        self.summary: str | None = None
-        self.x_properties: dict[str, str] = {}
+        self._state = ParseState()
+
+    def visit(self, node):
+        # Same walk as NodeVisitor.visit, but resolves the handler with one
+        # dict lookup instead of building "visit_<name>" and calling getattr
+        # per node.  The handlers here never raise, so the VisitationError
+        # wrapping is not needed.
+        children = [self.visit(child) for child in node]
+        method = self._DISPATCH.get(node.expr_name)
+        if method is None:
+            return self.generic_visit(node, children)
+        return method(self, node, children)
 
     def visit_add_tag(self, _node, visited_children):
         _, tag = visited_children
         if tag:
-            self._additions.append(tag)
+            self._state.additions.append(tag)
         return None
 
     def visit_remove_tag(self, _node, visited_children):
         _, tag = visited_children
         if tag:
-            self._removals.append(tag)
+            self._state.removals.append(tag)
         return None
 
     def visit_metadata(self, _node, visited_children):
         key, _, value = visited_children
         if key and isinstance(key, str):
-            key_lower = key.lower()
-
-            if key_lower == "project":
-                self.x_properties["X-PROJECT"] = value  # Empty string signals "unset"
-            elif key_lower == "due":
-                self.due = value  # Keep empty string to signal "unset"
-            elif key_lower == "wait":
-                self.wait = value  # Keep empty string to signal "unset"
-            elif key_lower == "pri":
-                if not value:
-                    self.priority = 0  # Use 0 to signal "unset"
-                else:
-                    parsed_priority = _parse_priority(value)
-                    if parsed_priority is not None:
-                        self.priority = parsed_priority
-            elif key_lower == "status":
-                self.status = value.upper() if value else None
-            elif key_lower == "summary":
-                self.summary = value
-            elif key_lower == "x" and value and ":" in value:
-                prop_key, prop_value = value.split(":", 1)
-                self.x_properties[prop_key] = prop_value
+            # Unknown keys are consumed by the grammar and simply dropped
+            apply_metadata(self._state, key, value)
         return None
 
     def visit_key(self, node, _visited_children):
@@ -106,42 +77,28 @@ class _UpdateVisitor(NodeVisitor):
         return node.text
 
     def visit_word(self, node, _visited_children):
-        self._description_parts.append(node.text)
+        self._state.description_parts.append(node.text)
         return None
 
     def visit_update(self, _node, _visited_children):
-        additions = set(self._additions)
-        removals = set(self._removals)
-        collision = additions & removals
-        if collision:
-            additions -= collision
-            removals -= collision
-
-        description = " ".join(part for part in self._description_parts if part.strip())
-        # Use summary if explicitly set, otherwise use description
-        final_summary = self.summary if self.summary is not None else (description if description else None)
-
-        add_data: TaskData[str] = TaskData(
-            summary=final_summary,
-            status=self.status,
-            due=self.due,
-            wait=self.wait,
-            priority=self.priority,
-            x_properties=self.x_properties,
-            categories=list(additions) if additions else None,
-        )
-
-        remove_data: TaskData[str] = TaskData(
-            categories=list(removals) if removals else None,
-        )
-
-        return UpdateDescriptor(add_data=add_data, remove_data=remove_data)
+        return build_descriptor(self._state)
 
     def generic_visit(self, node, visited_children):
         return visited_children or node.text
 
 
+_UpdateVisitor._DISPATCH = {
+    name.removeprefix("visit_"): function
+    for name, function in vars(_UpdateVisitor).items()
+    if name.startswith("visit_")
+}
+
+
 def parse_update(raw: str) -> UpdateDescriptor:
+    if not raw or raw.isspace():
+        # Nothing to parse; a fresh descriptor (not a shared singleton)
+        # because its TaskData fields are mutable.
+        return UpdateDescriptor()
     visitor = _UpdateVisitor()
-    tree = _UPDATE_GRAMMAR.parse(raw or "")
+    tree = _UPDATE_GRAMMAR.parse(raw)
     return visitor.visit(tree)
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from xml.etree import ElementTree
 
 import pytest
+from caldav.lib.url import URL
 
 from tdo.caldav_client import CalDAVClient
 from tdo.config import CaldavConfig
+from tdo.diff import TaskDiff, TaskSetDiff
 from tdo.models import Task, TaskData, TaskPatch, TaskPayload
 
 
@@ -68,6 +72,76 @@ def test_task_from_data_parses_fields() -> None:
     assert task.data.categories == ["plan", "review"]
 
 
+def test_task_from_data_handles_lf_params_and_folds() -> None:
+    client = CalDAVClient(CALENDAR_CONFIG)
+    body = "\n".join(
+        [
+            "BEGIN:VTODO",
+            "UID:task-101",
+            "SUMMARY:Plan",
+            " continued:text",
+            "PRIORITY:high",
+            "ATTACH;FMTTYPE=text/plain:https://example.com/a.txt",
+            "X-ORG;LANG=en:dev",
+            "END:VTODO",
+        ]
+    )
+    task = client._task_from_data(body)
+    assert task.uid == "task-101"
+    assert task.data.summary == "Plan"
+    assert task.data.priority is None
+    assert task.data.attachments[0].fmttype == "text/plain"
+    assert task.data.x_properties == {"X-ORG;LANG=en": "dev"}
+
+
+def test_task_from_data_ignores_timezone_and_alarm_components() -> None:
+    client = CalDAVClient(CALENDAR_CONFIG)
+    body = "\r\n".join(
+        [
+            "BEGIN:VCALENDAR",
+            "BEGIN:VTIMEZONE",
+            "TZID:Europe/Berlin",
+            "BEGIN:STANDARD",
+            "DTSTART:19701025T030000",
+            "END:STANDARD",
+            "END:VTIMEZONE",
+            "BEGIN:VTODO",
+            "UID:task-102",
+            "SUMMARY:Call",
+            "BEGIN:VALARM",
+            "SUMMARY:Reminder",
+            "END:VALARM",
+            "STATUS:IN-PROCESS",
+            "END:VTODO",
+            "END:VCALENDAR",
+        ]
+    )
+    task = client._task_from_data(body)
+    assert task.uid == "task-102"
+    assert task.data.summary == "Call"
+    assert task.data.status == "IN-PROCESS"
+    assert task.data.wait is None
+
+
+def test_task_from_data_reuses_parse_of_identical_body() -> None:
+    client = CalDAVClient(CALENDAR_CONFIG)
+    body = client._build_ics("Review", None, None, 1, {}, None, "task-103", None)
+    first = client._task_from_data(body)
+    first.href = "https://example.com/cal/a.ics"
+    second = client._task_from_data(body)
+    assert second is not first and second.href is None
+    assert second.data is first.data
+
+
+def test_due_format_round_trips_and_rejects_malformed() -> None:
+    client = CalDAVClient(CALENDAR_CONFIG)
+    value = datetime(2025, 1, 2, 3, 4, 5)
+    assert client._format_due(value) == "20250102T030405Z"
+    assert client._parse_due(client._format_due(value)) == value
+    for raw in ("", "20250102", "20250102X030405Z", "20251302T030405Z", "2025010 T030405Z"):
+        assert client._parse_due(raw) is None
+
+
 def test_ensure_calendar_raises_when_not_initialized() -> None:
     client = CalDAVClient(CALENDAR_CONFIG)
     with pytest.raises(RuntimeError):
@@ -114,3 +188,251 @@ async def test_delete_marks_remote_task_as_pending(client: CalDAVClient) -> None
     deleted_task = await client.cache.get_deleted_task(existing.uid)
     assert deleted_task is not None
     assert deleted_task.uid == existing.uid
+
+
+class _FakeResponse:
+    def __init__(self, body: str, status: int = 207) -> None:
+        self.status = status
+        self.tree = ElementTree.fromstring(body)
+
+
+class _FakeDAVClient:
+    def __init__(self, ctag: str, objects: dict[str, tuple[str, str]]) -> None:
+        self.ctag = ctag
+        self.objects = objects  # path -> (etag, ics)
+        self.reports: list[str] = []
+        self.puts: list[tuple[str, dict[str, str]]] = []
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.etag = '"p1"'
+
+    def put(self, url: str, body: str, headers: dict[str, str]) -> SimpleNamespace:
+        self.puts.append((url, headers))
+        if headers.get("If-Match", self.etag) != self.etag:
+            return SimpleNamespace(status=412, headers={})
+        return SimpleNamespace(status=201, headers={"ETag": self.etag})
+
+    def request(
+        self, url: str, method: str = "GET", body: str = "", headers: dict[str, str] | None = None
+    ) -> SimpleNamespace:
+        self.requests.append((method, url, dict(headers or {})))
+        if (headers or {}).get("If-Match", self.etag) != self.etag:
+            return SimpleNamespace(status=412, headers={})
+        return SimpleNamespace(status=204, headers={})
+
+    def propfind(self, url: str, props: bytes, depth: int = 0) -> _FakeResponse:
+        return _FakeResponse(
+            '<D:multistatus xmlns:D="DAV:" xmlns:CS="http://calendarserver.org/ns/">'
+            f"<D:response><D:href>/cal/</D:href><D:propstat><D:prop><CS:getctag>{self.ctag}</CS:getctag>"
+            "</D:prop></D:propstat></D:response></D:multistatus>"
+        )
+
+    def report(self, url: str, query: bytes, depth: int = 0) -> _FakeResponse:
+        query = query.decode()
+        self.reports.append(query)
+        multiget = "calendar-multiget" in query
+        parts = []
+        for path, (etag, ics) in self.objects.items():
+            if multiget and f"<D:href>{path}</D:href>" not in query:
+                continue
+            data = f"<C:calendar-data>{ics}</C:calendar-data>" if multiget else ""
+            parts.append(
+                f"<D:response><D:href>{path}</D:href><D:propstat><D:prop>"
+                f"<D:getetag>{etag}</D:getetag>{data}</D:prop></D:propstat></D:response>"
+            )
+        return _FakeResponse(
+            '<D:multistatus xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">'
+            + "".join(parts)
+            + "</D:multistatus>"
+        )
+
+
+def _install_fake_server(client: CalDAVClient, fake: _FakeDAVClient) -> None:
+    client.client = fake
+    client.calendar = SimpleNamespace(url=URL.objectify("https://example.com/cal/"))
+
+
+async def test_pull_only_downloads_changed_etags(client: CalDAVClient) -> None:
+    ics_a = client._build_ics("Alpha", None, None, None, {}, None, "a", None)
+    ics_b = client._build_ics("Beta", None, None, None, {}, None, "b", None)
+    fake = _FakeDAVClient("1", {"/cal/a.ics": ('"e1"', ics_a), "/cal/b.ics": ('"e1"', ics_b)})
+    _install_fake_server(client, fake)
+    await client.pull()
+    assert {t.uid for t in await client.cache.list_tasks()} == {"a", "b"}
+
+    fake.ctag = "2"
+    fake.objects["/cal/b.ics"] = ('"e2"', ics_b.replace("SUMMARY:Beta", "SUMMARY:Beta v2"))
+    fake.reports.clear()
+    result = await client.pull()
+    multiget = fake.reports[-1]
+    assert "/cal/b.ics" in multiget and "/cal/a.ics" not in multiget
+    assert {t.data.summary for t in result.tasks} == {"Alpha", "Beta v2"}
+
+
+async def test_pull_skips_fetch_when_ctag_unchanged(client: CalDAVClient) -> None:
+    ics = client._build_ics("Alpha", None, None, None, {}, None, "a", None)
+    fake = _FakeDAVClient("1", {"/cal/a.ics": ('"e1"', ics)})
+    _install_fake_server(client, fake)
+    await client.pull()
+    fake.reports.clear()
+    result = await client.pull()
+    assert fake.reports == []
+    assert result.diff.is_empty
+    assert [t.uid for t in result.tasks] == ["a"]
+
+
+async def test_push_puts_creates_and_guards_updates_with_etag(client: CalDAVClient) -> None:
+    fake = _FakeDAVClient("1", {})
+    _install_fake_server(client, fake)
+    created = await client.create_task(TaskPayload(summary="New task"))
+    result = await client.push()
+    assert not result.has_errors and result.created == 1
+    url, headers = fake.puts[-1]
+    assert url.startswith("https://example.com/cal/") and url.endswith(".ics")
+    assert headers["If-None-Match"] == "*"
+    stored = await client.cache.get_task(created.uid)
+    assert stored.href == url and stored.etag == '"p1"'
+    assert await client.cache.get_pending_action(created.uid) is None
+
+    await client.modify_task(stored, TaskPatch(summary="Edited"))
+    fake.etag = '"p2"'  # Someone else changed the object on the server
+    result = await client.push()
+    assert result.has_errors and result.errors[0].action == "update"
+    assert fake.puts[-1][1]["If-Match"] == '"p1"'
+    assert await client.cache.get_pending_action(created.uid) == "update"
+
+
+async def test_pull_refetches_rows_rewritten_by_undo(client: CalDAVClient) -> None:
+    ics = client._build_ics("Alpha", None, None, None, {}, None, "a", None)
+    fake = _FakeDAVClient("1", {"/cal/a.ics": ('"p1"', ics)})
+    _install_fake_server(client, fake)
+    await client.pull()
+    pulled = await client.cache.get_task("a")
+    await client.modify_task(pulled, TaskPatch(summary="Edited"))
+    assert not (await client.push()).has_errors
+    fake.ctag = "2"
+    # The server now holds the edit under the etag the push stored
+    fake.objects["/cal/a.ics"] = ('"p1"', ics.replace("SUMMARY:Alpha", "SUMMARY:Edited"))
+
+    # Undo the modify locally, the way the CLI's as_sql fallback does
+    edited = await client.cache.get_task("a")
+    undo = TaskSetDiff(diffs={"a": TaskDiff(pre=edited.data, post=pulled.data)})
+    for sql, params in undo.as_sql():
+        await client.cache._conn.execute(sql, params)
+    await client.cache._conn.commit()
+    assert (await client.cache.get_task("a")).etag is None
+
+    await client.pull()
+    assert (await client.cache.get_task("a")).data.summary == "Edited"
+
+
+async def test_noop_modify_does_not_queue_a_push(client: CalDAVClient) -> None:
+    await client.cache.upsert_task(Task(uid="a", data=TaskData(summary="Alpha", priority=2)))
+    task = await client.cache.get_task("a")
+    await client.modify_task(task, TaskPatch(priority=2))
+    assert await client.cache.get_pending_action("a") is None
+    await client.modify_task(task, TaskPatch(priority=3))
+    assert await client.cache.get_pending_action("a") == "update"
+
+
+def test_reentering_client_reuses_http_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    import caldav
+
+    from tdo import caldav_client
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.headers: dict[str, str] = {}
+            self.closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    class _FakeDAV:
+        def __init__(self, **kwargs: object) -> None:
+            self.session = _FakeSession()
+
+        def calendar(self, url: str) -> SimpleNamespace:
+            return SimpleNamespace(url=url)
+
+    monkeypatch.setattr(caldav, "DAVClient", _FakeDAV)
+    monkeypatch.setattr(caldav_client, "_SESSIONS", {})
+    config = CaldavConfig(
+        calendar_url="https://example.com/calendars/main", username="alice", password="secret"
+    )
+    client = CalDAVClient(config)
+    with client:
+        first = client.client.session
+    with client:
+        assert client.client.session is first
+    assert not first.closed
+    caldav_client._close_sessions()
+    assert first.closed
+
+
+async def test_pull_fetches_multiget_batches_concurrently(
+    client: CalDAVClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from tdo import caldav_client
+
+    monkeypatch.setattr(caldav_client, "_MULTIGET_BATCH", 2)
+    objects = {
+        f"/cal/{uid}.ics": ('"e1"', client._build_ics(uid, None, None, None, {}, None, uid, None))
+        for uid in "abcde"
+    }
+    fake = _FakeDAVClient("1", objects)
+    _install_fake_server(client, fake)
+    result = await client.pull()
+    assert sum("calendar-multiget" in query for query in fake.reports) == 3
+    assert sorted(t.uid for t in result.tasks) == list("abcde")
+
+
+def test_uid_pool_yields_distinct_safe_uids() -> None:
+    client = CalDAVClient(CALENDAR_CONFIG)
+    uids = [client._uid_from_summary("Buy milk: 2/3") for _ in range(300)]
+    assert len(set(uids)) == 300
+    prefix, _, suffix = uids[0].rpartition("-")
+    assert prefix == "Buy_milk__2_3"
+    assert len(suffix) == 16 and int(suffix, 16) >= 0
+
+
+def test_apply_patch_shares_untouched_containers() -> None:
+    from tdo.models import Attachment
+
+    client = CalDAVClient(CALENDAR_CONFIG)
+    task = Task(
+        uid="a",
+        data=TaskData(summary="A", x_properties={"X-PROJECT": "work"}, categories=["x"]),
+    )
+    updated = client._apply_patch(task, TaskPatch(priority=1))
+    assert updated.data.x_properties is task.data.x_properties
+    assert updated.data.categories is task.data.categories
+
+    updated = client._apply_patch(
+        task,
+        TaskPatch(x_properties={"X-PROJECT": ""}, attachments=[Attachment(uri="u")]),
+    )
+    assert updated.data.x_properties == {}
+    assert task.data.x_properties == {"X-PROJECT": "work"}
+    assert task.data.attachments == [] and len(updated.data.attachments) == 1
+
+
+async def test_push_deletes_by_cached_href(client: CalDAVClient) -> None:
+    fake = _FakeDAVClient("1", {})
+    _install_fake_server(client, fake)
+    href = "https://example.com/cal/a.ics"
+    for uid in ("a", "b"):
+        task = Task(uid=uid, data=TaskData(summary=uid), href=href, etag='"p1"')
+        await client.cache.upsert_task(task)
+    await client.delete_task("a")
+    result = await client.push()
+    assert not result.has_errors and result.deleted == 1
+    assert fake.requests == [("DELETE", href, {})]
+    assert await client.cache.list_deleted_tasks() == []
+
+    # A server-side edit after the pull must not leave the delete stuck:
+    # the etag of a deleted row is never refreshed, so no If-Match is sent
+    fake.etag = '"p2"'
+    await client.delete_task("b")
+    result = await client.push()
+    assert not result.has_errors and result.deleted == 1
+    assert await client.cache.list_deleted_tasks() == []
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import io
-from contextlib import redirect_stdout
-from datetime import datetime
+import logging
+from contextlib import asynccontextmanager, redirect_stdout
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import AsyncIterator, Sequence
 
 import pytest
 
@@ -55,6 +57,10 @@ class DummyClient:
     async def close(self) -> None:
         pass
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        yield
+
     async def create_task(self, payload: TaskPayload) -> Task:
         DummyClient.last_payload = payload
         task_index = DummyClient._next_index
@@ -114,6 +120,7 @@ class DummyClient:
         *,
         exclude_waiting: bool = True,
         task_filter: "TaskFilter | None" = None,
+        projection: Sequence[str] | None = None,
     ) -> list[Task]:
         # For tests, just return all tasks (no waiting logic needed)
         return await self.list_tasks_filtered(task_filter)
@@ -122,16 +129,18 @@ class DummyClient:
         self,
         *,
         task_filter: "TaskFilter | None" = None,
+        projection: Sequence[str] | None = None,
     ) -> list[Task]:
         # For tests, return empty list (no waiting tasks by default)
         return []
 
 
-async def _mock_cache_client(env: str | None) -> DummyClient:
-    config = CaldavConfig(
-        calendar_url="https://example.com/cal",
-        username="tester",
-    )
+async def _mock_cache_client(env: str | None, config: CaldavConfig | None = None) -> DummyClient:
+    if config is None:
+        config = CaldavConfig(
+            calendar_url="https://example.com/cal",
+            username="tester",
+        )
     return DummyClient(config)
 
 
@@ -230,6 +239,25 @@ def test_modify_command_adds_tag_without_other_changes() -> None:
     assert DummyClient.last_patch.categories == ["foo2"]
 
 
+def test_modify_command_resolves_due_once_for_all_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    DummyClient.list_entries = [
+        Task(uid="first", data=TaskData(summary="First", due=None, priority=1), task_index=1),
+        Task(uid="second", data=TaskData(summary="Second", due=None, priority=2), task_index=2),
+    ]
+    calls: list[str] = []
+    original = cli.parse_due_value
+
+    def counting_parse(raw: str):
+        calls.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(cli, "parse_due_value", counting_parse)
+    exit_code, stdout = run_cli(["1,2", "modify", "due:2h"])
+    assert exit_code == 0
+    assert "Updated (2):" in stdout
+    assert calls == ["2h"]
+
+
 def test_delete_command_accepts_filter_indices() -> None:
     DummyClient.list_entries = [
         Task(uid="first", data=TaskData(summary="Alpha", due=None, priority=1), task_index=1),
@@ -358,8 +386,7 @@ def test_list_command_accepts_config_file(tmp_path, monkeypatch: pytest.MonkeyPa
     monkeypatch.setenv("TDO_CONFIG_FILE", str(config_path))
     exit_code, stdout = run_cli(["list"])
     assert exit_code == 0
-    assert called
-    assert called[-1] == config_path
+    assert called == [config_path]
 
 
 def test_config_init_command_writes_file(tmp_path) -> None:
@@ -524,3 +551,41 @@ def test_move_command_preserves_task_metadata(monkeypatch: pytest.MonkeyPatch) -
     assert payload.x_properties.get("X-PROJECT") == "myproject"
     assert payload.x_properties.get("X-CUSTOM") == "value"
     assert payload.url == "https://example.com/task"
+
+
+@pytest.mark.parametrize(
+    ("offset", "expected"),
+    [
+        (timedelta(days=3, hours=5), "3d"),
+        (timedelta(hours=23, minutes=59), "23h"),
+        (timedelta(minutes=61), "1h"),
+        (timedelta(seconds=59), "0m"),
+        (-timedelta(minutes=1, seconds=1), "-1m"),
+        (-timedelta(days=2, seconds=5), "-2d"),
+    ],
+)
+def test_format_due_label_units(offset: timedelta, expected: str) -> None:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    assert cli._format_due_label(now + offset, now) == expected
+    assert cli._format_due_label(None, now) == "--"
+
+
+def test_list_command_writes_tsv_when_piped() -> None:
+    exit_code, stdout = run_cli(["list"])
+    assert exit_code == 0
+    lines = stdout.splitlines()
+    header = "ID\tAge\tProject\tTag\tDue\tDescription\tUrg"
+    assert header in lines
+    row = lines[lines.index(header) + 1].split("\t")
+    assert row[0] == "1" and row[5] == "List task"
+
+
+def test_debug_logging_only_enables_tdo_logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    tdo_logger = logging.getLogger("tdo")
+    monkeypatch.setattr(tdo_logger, "handlers", [])
+    monkeypatch.setattr(tdo_logger, "level", logging.NOTSET)
+    root_level = logging.getLogger().level
+    cli._enable_debug_logging()
+    cli._enable_debug_logging()
+    assert tdo_logger.level == logging.DEBUG and len(tdo_logger.handlers) == 1
+    assert logging.getLogger().level == root_level
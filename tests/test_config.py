@@ -59,3 +59,31 @@ def test_load_config_supports_legacy_format(tmp_path: Path) -> None:
     loaded = load_config(env="legacy", config_home=home)
     assert loaded.username == "alice"
     assert loaded.calendar_url == "https://example.com"
+
+
+def test_load_config_reuses_parsed_file_until_it_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    from tdo import config as config_module
+
+    target = config_file_path("cached", config_home=tmp_path)
+    write_config_file(target, CaldavConfig(calendar_url="https://example.com", username="alice"))
+    parsed: list[Path] = []
+    original = config_module._parse_toml_file
+
+    def counting_parse(path: Path):
+        parsed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(config_module, "_parse_toml_file", counting_parse)
+    assert load_config(env="cached", config_home=tmp_path).username == "alice"
+    assert load_config(env="cached", config_home=tmp_path).username == "alice"
+    assert len(parsed) == 1
+
+    write_config_file(target, CaldavConfig(calendar_url="https://example.com", username="bob"), force=True)
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(env="cached", config_home=tmp_path).username == "bob"
+    assert len(parsed) == 2
@@ -4,8 +4,8 @@ from pathlib import Path
 
 import pytest
 
-from tdo.models import Task, TaskData
-from tdo.sqlite_cache import SqliteTaskCache
+from tdo.models import Task, TaskData, TaskFilter
+from tdo.sqlite_cache import LISTING_COLUMNS, SqliteTaskCache
 
 
 @pytest.mark.asyncio
@@ -22,3 +22,111 @@ async def test_sqlite_cache_preserves_pending(tmp_path: Path) -> None:
         assert len(dirty) == 1 and dirty[0].task.uid == "pending"
     finally:
         await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_list_active_tasks_reads_only_projected_columns(tmp_path: Path) -> None:
+    cache = await SqliteTaskCache.create(tmp_path / "cache.db")
+    try:
+        task = Task(
+            uid="a",
+            data=TaskData(
+                summary="A",
+                x_properties={"X-PROJECT": "work"},
+                url="https://example.com",
+            ),
+            href="https://example.com/cal/a.ics",
+        )
+        await cache.upsert_task(task)
+        [listed] = await cache.list_active_tasks(columns=LISTING_COLUMNS)
+        assert listed.data.summary == "A"
+        assert listed.data.x_properties == {"X-PROJECT": "work"}
+        assert listed.data.url is None and listed.href is None
+        with pytest.raises(ValueError):
+            await cache.list_active_tasks(columns=("uid; DROP TABLE tasks",))
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_once_and_rolls_back_on_error(tmp_path: Path) -> None:
+    cache = await SqliteTaskCache.create(tmp_path / "cache.db")
+    try:
+        async with cache.transaction():
+            await cache.upsert_task(Task(uid="a", data=TaskData(summary="A")))
+            await cache.upsert_task(Task(uid="b", data=TaskData(summary="B")))
+        with pytest.raises(RuntimeError):
+            async with cache.transaction():
+                await cache.delete_task("a")
+                raise RuntimeError("boom")
+        assert {task.uid for task in await cache.list_tasks()} == {"a", "b"}
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_tag_filter_matches_non_ascii_tags(tmp_path: Path) -> None:
+    cache = await SqliteTaskCache.create(tmp_path / "cache.db")
+    try:
+        await cache.upsert_task(Task(uid="a", data=TaskData(summary="A", categories=["café"])))
+        await cache.upsert_task(Task(uid="b", data=TaskData(summary="B", categories=["cafe"])))
+        tasks = await cache.list_tasks_filtered(TaskFilter(tags=["café"]))
+        assert [task.uid for task in tasks] == ["a"]
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_orders_undated_tasks_last(tmp_path: Path) -> None:
+    from datetime import datetime
+
+    cache = await SqliteTaskCache.create(tmp_path / "cache.db")
+    try:
+        await cache.replace_remote_tasks(
+            [
+                Task(uid="undated", data=TaskData(summary="Undated")),
+                Task(uid="late", data=TaskData(summary="Late", due=datetime(2025, 3, 1))),
+                Task(uid="early", data=TaskData(summary="Early", due=datetime(2025, 1, 1))),
+            ]
+        )
+        assert [task.uid for task in await cache.list_tasks()] == ["early", "late", "undated"]
+        active = await cache.list_active_tasks()
+        assert [task.uid for task in active] == ["early", "late", "undated"]
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_empty_collections_are_stored_as_null(tmp_path: Path) -> None:
+    cache = await SqliteTaskCache.create(tmp_path / "cache.db")
+    try:
+        await cache.upsert_task(Task(uid="plain", data=TaskData(summary="Plain")))
+        assert cache._conn is not None
+        cursor = await cache._conn.execute(
+            "SELECT x_properties, categories, attachments FROM tasks WHERE uid = 'plain'"
+        )
+        assert tuple(await cursor.fetchone()) == (None, None, None)
+        [task] = await cache.list_tasks()
+        assert task.data.x_properties == {}
+        assert task.data.categories == []
+        assert task.data.attachments == []
+        assert await cache.list_active_tasks(task_filter=TaskFilter(tags=["x"])) == []
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_upsert_merges_pending_state_with_stored_row(tmp_path: Path) -> None:
+    cache = await SqliteTaskCache.create(tmp_path / "cache.db")
+    try:
+        task = Task(uid="a", data=TaskData(summary="A"))
+        await cache.upsert_task(task, pending_action="create", last_synced=10.0, task_index=3)
+        # No pending action/index given: the stored ones are kept
+        await cache.upsert_task(Task(uid="a", data=TaskData(summary="A2")))
+        assert await cache.get_pending_action("a") == "create"
+        [stored] = await cache.list_tasks()
+        assert stored.data.summary == "A2" and stored.task_index == 3
+        await cache.upsert_task(stored, clear_pending=True)
+        assert await cache.get_pending_action("a") is None
+    finally:
+        await cache.close()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import arrow
 import pytest
 
-from tdo.time_parser import parse_due_value
+from tdo.time_parser import _cached_now, _reset_now_cache, parse_due_value
 
 
 REFERENCE = arrow.get("2025-05-15T10:30:00")
@@ -274,6 +274,13 @@ def test_ordinal_31st_finds_previous_31st_day() -> None:
     assert result == arrow.get("2025-03-31T00:00:00")
 
 
+def test_ordinal_31st_from_thirty_day_month() -> None:
+    # April has no 31st, so the current month is skipped entirely
+    april_ref = arrow.get("2025-04-10T10:00:00")
+    result = parse_due_value("31st", april_ref)
+    assert result == arrow.get("2025-03-31T00:00:00")
+
+
 def test_ordinal_30th_in_march_finds_february_28() -> None:
     # Reference in March - asking for 30th
     march_ref = arrow.get("2025-03-15T10:00:00")
@@ -356,3 +363,11 @@ def test_empty_and_none_inputs() -> None:
     assert parse_due_value("", REFERENCE) is None
     assert parse_due_value("   ", REFERENCE) is None
     assert parse_due_value(None, REFERENCE) is None  # type: ignore[arg-type]
+
+
+def test_cached_now_reuses_reading_within_ttl() -> None:
+    _reset_now_cache()
+    first = _cached_now(ttl_ns=10**12)
+    assert _cached_now(ttl_ns=10**12) is first
+    _reset_now_cache()
+    assert _cached_now(ttl_ns=10**12) is not first
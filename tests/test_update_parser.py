@@ -4,6 +4,7 @@ import random
 
 from tdo.models import TaskData
 from tdo.update_linear_parser import parse_update as parse_update_linear
+from tdo.update_linear_parser import parse_update_tokens
 from tdo.update_descriptor import UpdateDescriptor
 from tdo.update_parser import parse_update as parse_update_grammar
 
@@ -267,3 +268,29 @@ def test_parse_update_examples() -> None:
         actual = _normalize_descriptor(parse_update(raw))
         expected_normalized = _normalize_descriptor(expected)
         assert actual == expected_normalized, f"Mismatch for input: {raw!r}"
+
+
+def test_priority_words_digits_and_garbage() -> None:
+    assert parse_update("pri:High").add_data.priority == 1
+    assert parse_update("pri:7").add_data.priority == 7
+    assert parse_update("pri:-3").add_data.priority == -3
+    assert parse_update("pri:urgent").add_data.priority is None
+    assert parse_update("pri:²").add_data.priority is None
+
+
+def test_parse_update_tokens_matches_joined_string() -> None:
+    for raw in _generate_fuzz_inputs(seed=2):
+        tokens = raw.split(" ")
+        expected = _normalize_descriptor(parse_update_linear(" ".join(tokens)))
+        actual = _normalize_descriptor(parse_update_tokens(tokens))
+        assert actual == expected, f"Mismatch for input: {raw!r}"
+    quoted = parse_update_tokens(["buy  milk", "+errand"])
+    assert quoted.add_data.summary == "buy milk"
+
+
+def test_blank_input_returns_fresh_empty_descriptor() -> None:
+    for parse in (parse_update_linear, parse_update_grammar):
+        first = parse("")
+        second = parse("  \t")
+        assert first == second == UpdateDescriptor()
+        assert first.add_data is not second.add_data